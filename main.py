@@ -7,6 +7,7 @@ Sie ermöglicht die Auswahl zwischen verschiedenen Modulen.
 import sys
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -27,8 +28,152 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QWidget, QMessageBox, QDialog, QFrame, QGridLayout
 )
-from PySide6.QtCore import Qt, QSize, QTimer
-from PySide6.QtGui import QIcon, QFont, QPixmap
+from PySide6.QtCore import Qt, QSize, QTimer, QObject, QEvent, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QIcon, QFont, QPixmap, QPixmapCache, QPainter, QColor, QPen
+
+
+# Projektpfade einmalig beim Import auflösen
+_HERE = Path(__file__).resolve().parent
+_DHL_PATH = _HERE / "modules" / "dhl_label_tool"
+_STYLE_PATH = _HERE / "global_style.qss"
+
+# Farben und Größe der Status-Lämpchen
+STATUS_LIGHT_OK = "#28a745"
+STATUS_LIGHT_ERROR = "#dc3545"
+STATUS_LIGHT_BORDER = "#dee2e6"
+STATUS_LIGHT_SIZE = 12
+
+# Styles der Modulauswahl. Werden direkt am Fenster gesetzt, da Module wie das
+# DHL Label Tool das Stylesheet der QApplication durch ihr eigenes ersetzen.
+_SELECTOR_STYLE = """
+/* Header-Bereich der Modulauswahl */
+QFrame#headerFrame {
+    background-color: #ffffff;
+    border: 1px solid #e9ecef;
+    border-radius: 8px;
+    padding: 15px;
+}
+
+/* Container der Modul-Buttons */
+QFrame#buttonFrame {
+    background-color: #f8f9fa;
+    border: 1px solid #dee2e6;
+    border-radius: 8px;
+    padding: 20px;
+}
+
+/* Update-Button im Header */
+QPushButton#updateButton {
+    background-color: #28a745;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    font-size: 12px;
+    font-weight: bold;
+}
+
+QPushButton#updateButton:hover {
+    background-color: #218838;
+}
+
+/* Log-Toggle-Button im Header */
+QPushButton#logToggleButton {
+    background-color: #6c757d;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    font-size: 12px;
+    font-weight: bold;
+}
+
+QPushButton#logToggleButton:hover {
+    background-color: #5a6268;
+}
+
+QPushButton#logToggleButton:checked {
+    background-color: #28a745;
+}
+"""
+
+
+def _center_on_primary_screen(widget: QWidget) -> None:
+    """Widget auf dem primären Bildschirm zentrieren."""
+    screen = QApplication.primaryScreen().geometry()
+    x = (screen.width() - widget.width()) // 2
+    y = (screen.height() - widget.height()) // 2
+    widget.move(x, y)
+
+
+@lru_cache(maxsize=None)
+def _header_font(point_size: int, bold: bool = False) -> QFont:
+    """Header-Schriften einmalig erzeugen (erst nach QApplication, daher lazy)."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+def _status_light_pixmap(color: str) -> QPixmap:
+    """Status-Lämpchen einmalig rendern und über den QPixmapCache wiederverwenden."""
+    key = f"status_light_{color}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+
+    dpr = QApplication.instance().devicePixelRatio() if QApplication.instance() else 1.0
+    pixmap = QPixmap(int(STATUS_LIGHT_SIZE * dpr), int(STATUS_LIGHT_SIZE * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(QPen(QColor(STATUS_LIGHT_BORDER), 1))
+    painter.setBrush(QColor(color))
+    painter.drawEllipse(0, 0, STATUS_LIGHT_SIZE - 1, STATUS_LIGHT_SIZE - 1)
+    painter.end()
+
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class _HideOnCloseFilter(QObject):
+    """Event-Filter, der Fenster beim Schließen nur versteckt statt sie zu zerstören."""
+
+    def __init__(self, logger, parent=None):
+        super().__init__(parent)
+        self.logger = logger
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Close:
+            self.logger.info(f"{obj.windowTitle() or obj.objectName()} wurde geschlossen (versteckt)")
+            obj.hide()
+            event.ignore()
+            return True
+        return False
+
+
+class _UpdateCheckSignals(QObject):
+    """Signale für den Update-Check im Hintergrund."""
+
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class _UpdateCheckRunnable(QRunnable):
+    """Führt den (netzwerkgebundenen) Git-Update-Check im Thread-Pool aus."""
+
+    def __init__(self, signals: _UpdateCheckSignals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        try:
+            # Kein Parent-Widget: im Worker-Thread dürfen keine Dialoge entstehen
+            update_info = GitUpdater().check_for_updates()
+            self.signals.finished.emit(update_info)
+        except Exception as e:
+            import traceback
+            self.signals.failed.emit(f"{e}\n{traceback.format_exc()}")
 
 
 class LogWindow(QMainWindow):
@@ -46,14 +191,7 @@ class LogWindow(QMainWindow):
         self.setCentralWidget(self.terminal_mirror)
         
         # Fenster zentrieren
-        self._center_window()
-        
-    def _center_window(self):
-        """Fenster zentrieren."""
-        screen = QApplication.primaryScreen().geometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
-        self.move(x, y)
+        _center_on_primary_screen(self)
         
     def closeEvent(self, event):
         """Beim Schließen nur verstecken und Parent-Button zurücksetzen."""
@@ -75,6 +213,14 @@ class ModuleSelector(QMainWindow):
         self.credential_cache = None
         self.log_window: Optional[LogWindow] = None
         self.rma_window = None  # Referenz auf das RMA Database GUI Fenster
+        self._hide_on_close_filter = _HideOnCloseFilter(self.logger, self)
+        self._status_dirty = False  # Status-Update ausstehend, solange das Fenster verborgen ist
+
+        # Update-Check läuft im Hintergrund, Ergebnisse kommen per Signal zurück
+        self._update_check_running = False
+        self._update_check_signals = _UpdateCheckSignals(self)
+        self._update_check_signals.finished.connect(self._on_silent_update_check_finished)
+        self._update_check_signals.failed.connect(self._on_silent_update_check_failed)
         
         self.setWindowTitle("RMA-Tool - Modulauswahl")
         self.setGeometry(100, 100, 800, 500)
@@ -84,7 +230,7 @@ class ModuleSelector(QMainWindow):
         if self._authenticate():
             self._setup_ui()
             self._update_status()  # Status nach UI-Erstellung aktualisieren
-            self._center_window()
+            _center_on_primary_screen(self)
             # RMA-DB-GUI im Hintergrund vorladen, damit das erste Öffnen instant ist
             QTimer.singleShot(0, self._preload_rma_database_gui)
             # Update-Check nach UI-Erstellung durchführen
@@ -102,6 +248,7 @@ class ModuleSelector(QMainWindow):
     def _setup_ui(self):
         """Benutzeroberfläche einrichten."""
         central_widget = QWidget()
+        central_widget.setStyleSheet(_SELECTOR_STYLE)
         self.setCentralWidget(central_widget)
         
         # Hauptlayout
@@ -122,14 +269,7 @@ class ModuleSelector(QMainWindow):
         """Header mit Titel, Status-Lämpchen und Log-Toggle erstellen."""
         header_frame = QFrame()
         header_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        header_frame.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 1px solid #e9ecef;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        header_frame.setObjectName("headerFrame")
         
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(15, 15, 15, 15)
@@ -139,18 +279,13 @@ class ModuleSelector(QMainWindow):
         
         title_label = QLabel("RMA-Tool")
         title_label.setProperty("class", "title")
-        title_font = QFont()
-        title_font.setPointSize(20)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_header_font(20, bold=True))
         title_label.setStyleSheet("color: #212529; margin-bottom: 5px;")
         title_layout.addWidget(title_label)
         
         subtitle_label = QLabel("Wählen Sie ein Modul aus")
         subtitle_label.setProperty("class", "subtitle")
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(11)
-        subtitle_label.setFont(subtitle_font)
+        subtitle_label.setFont(_header_font(11))
         subtitle_label.setStyleSheet("color: #6c757d;")
         title_layout.addWidget(subtitle_label)
         
@@ -173,19 +308,7 @@ class ModuleSelector(QMainWindow):
         self.update_button.setFixedSize(80, 30)
         self.update_button.clicked.connect(self._check_for_updates)
         self.update_button.setVisible(True)  # Always visible for testing
-        self.update_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        self.update_button.setObjectName("updateButton")
         header_layout.addWidget(self.update_button)
 
         # Update notification indicator (small dot)
@@ -206,22 +329,7 @@ class ModuleSelector(QMainWindow):
         self.log_toggle_button.setCheckable(True)
         self.log_toggle_button.setFixedSize(80, 30)
         self.log_toggle_button.clicked.connect(self._toggle_log_window)
-        self.log_toggle_button.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-            QPushButton:checked {
-                background-color: #28a745;
-            }
-        """)
+        self.log_toggle_button.setObjectName("logToggleButton")
         header_layout.addWidget(self.log_toggle_button)
         
         parent_layout.addWidget(header_frame)
@@ -232,15 +340,15 @@ class ModuleSelector(QMainWindow):
         status_layout.setSpacing(8)
         
         # KeePass Status-Lämpchen
-        self.kp_status_light = self._create_status_light("#dc3545", "KeePass: Nicht verbunden")
+        self.kp_status_light = self._create_status_light(STATUS_LIGHT_ERROR, "KeePass: Nicht verbunden")
         status_layout.addWidget(self.kp_status_light)
         
         # Credential Cache Status-Lämpchen
-        self.cache_status_light = self._create_status_light("#dc3545", "Credential Cache: Nicht aktiv")
+        self.cache_status_light = self._create_status_light(STATUS_LIGHT_ERROR, "Credential Cache: Nicht aktiv")
         status_layout.addWidget(self.cache_status_light)
         
         # Log-Status-Lämpchen
-        self.log_status_light = self._create_status_light("#28a745", "Logging: Aktiv")
+        self.log_status_light = self._create_status_light(STATUS_LIGHT_OK, "Logging: Aktiv")
         status_layout.addWidget(self.log_status_light)
         
         parent_layout.addLayout(status_layout)
@@ -248,14 +356,8 @@ class ModuleSelector(QMainWindow):
     def _create_status_light(self, color: str, tooltip: str) -> QLabel:
         """Ein einzelnes Status-Lämpchen erstellen."""
         light = QLabel()
-        light.setFixedSize(12, 12)
-        light.setStyleSheet(f"""
-            QLabel {{
-                background-color: {color};
-                border-radius: 6px;
-                border: 1px solid #dee2e6;
-            }}
-        """)
+        light.setFixedSize(STATUS_LIGHT_SIZE, STATUS_LIGHT_SIZE)
+        light.setPixmap(_status_light_pixmap(color))
         light.setToolTip(tooltip)
         return light
         
@@ -264,14 +366,7 @@ class ModuleSelector(QMainWindow):
         # Button-Container
         button_frame = QFrame()
         button_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        button_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        button_frame.setObjectName("buttonFrame")
         
         button_layout = QHBoxLayout(button_frame)
         button_layout.setSpacing(20)
@@ -365,31 +460,39 @@ class ModuleSelector(QMainWindow):
                 )
 
     def _check_for_updates_silently(self):
-        """Silent update check to update the indicator."""
-        self.logger.info("Starting silent update check...")
-        try:
-            self.logger.info("Creating GitUpdater instance...")
-            updater = GitUpdater(self)
+        """Silent update check to update the indicator.
 
-            self.logger.info("Calling check_for_updates()...")
-            update_info = updater.check_for_updates()
+        The git fetch runs on the global thread pool so the UI stays responsive;
+        the result is delivered back to the main thread via a queued signal.
+        """
+        if self._update_check_running:
+            self.logger.info("Silent update check already running, skipping")
+            return
 
-            # Update indicator visibility (button always visible for testing)
-            has_updates = update_info.has_updates
-            self.update_indicator.setVisible(has_updates)
-            # Keep button always visible for testing
-            # self.update_button.setVisible(has_updates)
+        self.logger.info("Starting silent update check...")
+        self._update_check_running = True
+        QThreadPool.globalInstance().start(_UpdateCheckRunnable(self._update_check_signals))
+
+    def _on_silent_update_check_finished(self, update_info):
+        """Ergebnis des Hintergrund-Update-Checks anzeigen."""
+        self._update_check_running = False
+
+        # Update indicator visibility (button always visible for testing)
+        has_updates = update_info.has_updates
+        self.update_indicator.setVisible(has_updates)
+        # Keep button always visible for testing
+        # self.update_button.setVisible(has_updates)
+
+        if has_updates:
+            self.logger.info(f"Updates available: {update_info.commits_behind} commits")
+            self.logger.info(f"Changelog: {update_info.changelog}")
+        else:
+            self.logger.info("No updates available")
 
-            if has_updates:
-                self.logger.info(f"Updates available: {update_info.commits_behind} commits")
-                self.logger.info(f"Changelog: {update_info.changelog}")
-            else:
-                self.logger.info("No updates available")
-
-        except Exception as e:
-            self.logger.error(f"Silent update check failed: {str(e)}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+    def _on_silent_update_check_failed(self, error: str):
+        """Fehler des Hintergrund-Update-Checks protokollieren."""
+        self._update_check_running = False
+        self.logger.error(f"Silent update check failed: {error}")
 
     def _restart_application(self):
         """Restart the application after update."""
@@ -417,64 +520,45 @@ class ModuleSelector(QMainWindow):
                 f"Das System konnte nicht neu gestartet werden: {str(e)}"
             )
         
-    def _center_window(self):
-        """Fenster zentrieren."""
-        screen = QApplication.primaryScreen().geometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
-        self.move(x, y)
-        
+    def showEvent(self, event):
+        """Beim Anzeigen ausstehende Status-Updates nachholen."""
+        super().showEvent(event)
+        if self._status_dirty:
+            self._update_status()
+
+    def changeEvent(self, event):
+        """Nach dem Wiederherstellen aus dem minimierten Zustand Status nachholen."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and self._status_dirty:
+            self._update_status()
+
     def _update_status(self):
         """Status-Anzeige aktualisieren."""
+        # Verborgene/minimierte Fenster nicht neu stylen, sondern beim nächsten showEvent
+        if not self.isVisible() or self.isMinimized():
+            self._status_dirty = True
+            return
+        self._status_dirty = False
+
         # KeePass Status
         if self.kp_handler and self.kp_handler.is_database_open():
-            self.kp_status_light.setStyleSheet("""
-                QLabel {
-                    background-color: #28a745;
-                    border-radius: 6px;
-                    border: 1px solid #dee2e6;
-                }
-            """)
+            self.kp_status_light.setPixmap(_status_light_pixmap(STATUS_LIGHT_OK))
             self.kp_status_light.setToolTip("KeePass: Verbunden")
         else:
-            self.kp_status_light.setStyleSheet("""
-                QLabel {
-                    background-color: #dc3545;
-                    border-radius: 6px;
-                    border: 1px solid #dee2e6;
-                }
-            """)
+            self.kp_status_light.setPixmap(_status_light_pixmap(STATUS_LIGHT_ERROR))
             self.kp_status_light.setToolTip("KeePass: Nicht verbunden")
         
         # Credential Cache Status
         if self.credential_cache and self.credential_cache.has_valid_session():
             cache_stats = self.credential_cache.get_cache_stats()
-            self.cache_status_light.setStyleSheet("""
-                QLabel {
-                    background-color: #28a745;
-                    border-radius: 6px;
-                    border: 1px solid #dee2e6;
-                }
-            """)
+            self.cache_status_light.setPixmap(_status_light_pixmap(STATUS_LIGHT_OK))
             self.cache_status_light.setToolTip(f"Credential Cache: Aktiv ({cache_stats['valid_credentials']} Credentials)")
         else:
-            self.cache_status_light.setStyleSheet("""
-                QLabel {
-                    background-color: #dc3545;
-                    border-radius: 6px;
-                    border: 1px solid #dee2e6;
-                }
-            """)
+            self.cache_status_light.setPixmap(_status_light_pixmap(STATUS_LIGHT_ERROR))
             self.cache_status_light.setToolTip("Credential Cache: Nicht aktiv")
             
         # Log-Status bleibt immer grün
-        self.log_status_light.setStyleSheet("""
-            QLabel {
-                background-color: #28a745;
-                border-radius: 6px;
-                border: 1px solid #dee2e6;
-            }
-        """)
+        self.log_status_light.setPixmap(_status_light_pixmap(STATUS_LIGHT_OK))
         self.log_status_light.setToolTip("Logging: Aktiv")
             
     def _authenticate(self) -> bool:
@@ -483,17 +567,17 @@ class ModuleSelector(QMainWindow):
             try:
                 # Credential Cache initialisieren
                 self.credential_cache = initialize_credential_cache()
-                log("Credential cache initialized")
+                log.add_event("Credential cache initialized")
                 
                 if not self.kp_handler:
                     self.kp_handler = CentralKeePassHandler()
-                    log("Central KeePass handler initialized")
+                    log.add_event("Central KeePass handler initialized")
                 
                 if not self.kp_handler.is_database_open():
-                    log("Login Dialog")
+                    log.add_event("Login Dialog")
                     login_window = CentralLoginWindow(self.kp_handler)
                     if login_window.exec() != QDialog.DialogCode.Accepted:
-                        log("Login cancelled by user")
+                        log.add_event("Login cancelled by user")
                         return False
                     
                     # Benutzer-Credentials aus dem Login-Fenster extrahieren
@@ -501,9 +585,9 @@ class ModuleSelector(QMainWindow):
                     if credentials:
                         initials, master_pw = credentials
                         self.kp_handler.set_user_credentials(initials, master_pw)
-                        log(f"User credentials stored for: {initials}")
+                        log.add_event("User credentials stored", initials=initials)
                     
-                    log("Login successful")
+                    log.add_event("Login successful")
                 
                 return True
                 
@@ -516,18 +600,17 @@ class ModuleSelector(QMainWindow):
         """DHL Label Tool starten."""
         with log_block("DHL Label Tool Start") as log:
             try:
-                log("Module Import")
+                log.add_event("Module Import")
                 # Importiere das DHL-Tool direkt
-                import sys
-                import os
-                dhl_path = os.path.join(os.path.dirname(__file__), "modules", "dhl_label_tool")
-                sys.path.insert(0, dhl_path)
+                dhl_path = str(_DHL_PATH)
+                if dhl_path not in sys.path:
+                    sys.path.insert(0, dhl_path)
                 from main import main as dhl_main
                 
-                log("Module Execution")
+                log.add_event("Module Execution")
                 # Starte das DHL-Tool direkt
                 dhl_main()
-                log("DHL Label Tool erfolgreich gestartet")
+                log.add_event("DHL Label Tool erfolgreich gestartet")
                 
             except ImportError as e:
                 log(f"Import error: {str(e)}")
@@ -550,16 +633,16 @@ class ModuleSelector(QMainWindow):
         """RMA Database GUI starten oder wieder anzeigen."""
         with log_block("RMA Database GUI Start") as log:
             try:
-                log("Module Import")
+                log.add_event("Module Import")
                 from modules.rma_db_gui.gui.main_window import MainWindow
 
-                log("Module Execution")
+                log.add_event("Module Execution")
                 # Prüfe, ob das Fenster schon existiert
                 if self.rma_window is not None:
                     self.rma_window.show()
                     self.rma_window.raise_()
                     self.rma_window.activateWindow()
-                    log("RMA Database GUI wieder angezeigt")
+                    log.add_event("RMA Database GUI wieder angezeigt")
                 else:
                     # Initialen des eingeloggten Nutzers holen
                     initials = None
@@ -570,14 +653,10 @@ class ModuleSelector(QMainWindow):
                     if not initials:
                         initials = "MWO"
                     self.rma_window = MainWindow(current_user=initials)
+                    # Beim Schließen nur verstecken, damit die Instanz erhalten bleibt
+                    self.rma_window.installEventFilter(self._hide_on_close_filter)
                     self.rma_window.show()
-                    # Wenn das Fenster geschlossen wird, Referenz löschen und Logging
-                    def on_close(event):
-                        log("RMA Database GUI wurde geschlossen (versteckt)")
-                        self.rma_window.hide()
-                        event.ignore()
-                    self.rma_window.closeEvent = on_close
-                    log("RMA Database GUI erfolgreich gestartet")
+                    log.add_event("RMA Database GUI erfolgreich gestartet")
 
             except ImportError as e:
                 log(f"Import error: {str(e)}")
@@ -617,12 +696,8 @@ class ModuleSelector(QMainWindow):
             # Fenster erstellen, aber nicht anzeigen
             self.rma_window = MainWindow(current_user=initials)
 
-            # closeEvent so setzen, dass es immer nur versteckt wird
-            def on_close(event):
-                self.logger.info("RMA Database GUI wurde geschlossen (versteckt)")
-                self.rma_window.hide()
-                event.ignore()
-            self.rma_window.closeEvent = on_close
+            # Beim Schließen immer nur verstecken
+            self.rma_window.installEventFilter(self._hide_on_close_filter)
 
             # Nicht anzeigen – nur vorbereiten (Daten laden, Timer initialisieren)
             self.logger.info("RMA Database GUI vorab geladen (versteckt)")
@@ -653,9 +728,8 @@ def main():
             app.setApplicationVersion("1.0.0")
             
             # Globales Stylesheet laden
-            style_path = Path(__file__).parent / "global_style.qss"
-            if style_path.exists():
-                with open(style_path, "r", encoding="utf-8") as f:
+            if _STYLE_PATH.exists():
+                with open(_STYLE_PATH, "r", encoding="utf-8") as f:
                     app.setStyleSheet(f.read())
                     log("Global stylesheet loaded")
             
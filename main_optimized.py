@@ -6,44 +6,48 @@ Sie ermöglicht die Auswahl zwischen verschiedenen Modulen.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 # PyQt6 Imports
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QWidget, QMessageBox, QDialog, QFrame
-from shared.utils.enhanced_logging import LoggingMessageBox, log_error_and_show_dialog
-
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QIcon, QFont, QPixmap
+from PyQt6.QtCore import Qt
 
 # Zentrale Infrastruktur importieren
 from shared.credentials import CentralKeePassHandler, CentralLoginWindow
 from shared.credentials.credential_cache import (
     initialize_credential_cache, get_credential_cache
 )
-from shared.credentials.credential_manager import CredentialManager
 from shared.utils.logger import setup_logger, LogBlock
 from shared.utils.error_handler import ErrorHandler
 from shared.config.settings import Settings
 
+if TYPE_CHECKING:
+    from shared.credentials.credential_manager import CredentialManager
+
 
 class ModuleSelector(QMainWindow):
     """Hauptfenster für die Modulauswahl."""
 
-    def __init__(self):
-        """Initialisiere das Hauptfenster."""
+    def __init__(self, settings: Optional[Settings] = None):
+        """Initialisiere das Hauptfenster.
+
+        Args:
+            settings: Bereits geladene Einstellungen (sonst neu geladen)
+        """
         super().__init__()
         
         # Zentrale Komponenten initialisieren
-        self.settings = Settings()
+        self.settings = settings if settings is not None else Settings()
         self.logger = setup_logger("RMA-Tool.Main")
         self.error_handler = ErrorHandler()
         self.kp_handler: Optional[CentralKeePassHandler] = None
         self.credential_cache = None
-        self.credential_manager: Optional[CredentialManager] = None
+        self.credential_manager: Optional["CredentialManager"] = None
 
         # Fenster-Einstellungen anwenden
         window_settings = self.settings.get_window_settings()
@@ -64,6 +68,9 @@ class ModuleSelector(QMainWindow):
 
     def _setup_ui(self):
         """Benutzeroberfläche einrichten."""
+        # Erst beim Aufbau der Oberfläche benötigt
+        from PyQt6.QtGui import QFont
+
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
 
@@ -245,7 +252,8 @@ class ModuleSelector(QMainWindow):
 
                     log("Login successful")
 
-                # Credential Manager initialisieren
+                # Credential Manager initialisieren (erst nach erfolgreichem Login benötigt)
+                from shared.credentials.credential_manager import CredentialManager
                 self.credential_manager = CredentialManager(self.kp_handler)
                 log("Credential manager initialized")
 
@@ -305,30 +313,85 @@ class ModuleSelector(QMainWindow):
                 )
 
 
+def _sanity_check(settings: Settings) -> Optional[str]:
+    """Prüfe die Konfiguration ohne Qt.
+
+    Args:
+        settings: Geladene Einstellungen
+
+    Returns:
+        Fehlermeldung oder None, wenn die Konfiguration brauchbar ist
+    """
+    if not isinstance(settings.get_window_settings(), dict):
+        return "Ungültige Fenster-Einstellungen in der Konfiguration"
+
+    modules = settings.get("modules", {})
+    if not isinstance(modules, dict):
+        return "Ungültige Modul-Einstellungen in der Konfiguration"
+    if not any(
+        settings.is_module_enabled(name)
+        for name in ("dhl_label_tool", "rma_db_gui")
+    ):
+        return "Kein Modul aktiviert - bitte Konfiguration prüfen"
+
+    return None
+
+
+def _load_stylesheet(style_path: Path) -> Optional[str]:
+    """Lies das globale Stylesheet.
+
+    Args:
+        style_path: Pfad zur QSS-Datei
+
+    Returns:
+        Inhalt des Stylesheets oder None, wenn die Datei fehlt
+    """
+    if not style_path.exists():
+        return None
+    return style_path.read_text(encoding="utf-8")
+
+
 def main():
     """Hauptfunktion der Anwendung."""
+    # Stylesheet im Hintergrund lesen, während Einstellungen und Qt
+    # initialisiert werden
+    startup_pool = ThreadPoolExecutor(max_workers=1)
+    stylesheet_future = startup_pool.submit(
+        _load_stylesheet, Path(__file__).parent / "global_style.qss"
+    )
+    startup_pool.shutdown(wait=False)
+
     logger = setup_logger("RMA-Tool.Main")
+
+    # Konfiguration vor Qt prüfen, damit Fehlkonfigurationen ohne
+    # QApplication-Start abbrechen
+    settings = Settings()
+    problem = _sanity_check(settings)
+    if problem:
+        logger.error(problem)
+        print(f"RMA-Tool: {problem}", file=sys.stderr)
+        sys.exit(1)
+
     error_handler = ErrorHandler()
     
     with LogBlock(logger) as log:
         try:
             log.section("Application Initialization")
 
-            # QApplication erstellen
+            # QApplication erst jetzt erstellen
             app = QApplication(sys.argv)
             app.setApplicationName("RMA-Tool")
             app.setApplicationVersion("1.0.0")
 
-            # Globales Stylesheet laden
-            style_path = Path(__file__).parent / "global_style.qss"
-            if style_path.exists():
-                with open(style_path, "r", encoding="utf-8") as f:
-                    app.setStyleSheet(f.read())
-                    log("Global stylesheet loaded")
+            # Globales Stylesheet übernehmen (vor dem Login-Dialog)
+            stylesheet = stylesheet_future.result()
+            if stylesheet is not None:
+                app.setStyleSheet(stylesheet)
+                log("Global stylesheet loaded")
 
             # Hauptfenster erstellen und anzeigen
             log.section("Main Window")
-            window = ModuleSelector()
+            window = ModuleSelector(settings)
             window.show()  # Fenster anzeigen
             log("Main window displayed")
 
@@ -1,17 +1,87 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import re
 import logging
-from typing import Optional, List
+from operator import itemgetter
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, List, Tuple
+from PySide6.QtCore import QCoreApplication, QThread
 from PySide6.QtWidgets import QMessageBox
 from shared.utils.enhanced_logging import LoggingMessageBox, log_error_and_show_dialog, get_module_logger
 from shared.utils.logger import LogBlock
 
+# orjson parst die teils großen Bestell-/Adress-Antworten deutlich schneller,
+# ist aber optional; ohne orjson wird das Standard-json verwendet
+try:
+    import orjson
+    _loads, _dumps = orjson.loads, orjson.dumps
+except ImportError:
+    _loads, _dumps = json.loads, lambda data: json.dumps(data).encode("utf-8")
+
+
+def _json_loads(content: bytes):
+    """Parst eine API-Antwort; Fehler werden wie bei response.json() als RequestException gemeldet."""
+    try:
+        return _loads(content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(str(e))
+
+
+def _json_body(data) -> bytes:
+    """Serialisiert einen Request-Body einmalig zu UTF-8-Bytes."""
+    return _dumps(data)
+
+
+def _json_dumps(data) -> str:
+    return _dumps(data).decode("utf-8")
+
+
+LOG_SEPARATOR = "-" * 80
+
+# Kunden-IDs ändern sich praktisch nie; 5 Minuten Cache erspart wiederholte Suchanfragen
+CUSTOMER_ID_CACHE_TTL = 300
+CUSTOMER_ID_CACHE_SIZE = 512
+
+# Anzahl der per ETag zwischengespeicherten GET-Antworten (Adressen, Bestellungen, Notizen)
+ETAG_CACHE_SIZE = 256
+
+# Seriennummern-Muster in Prioritätsreihenfolge, einmalig kompiliert
+SERIAL_NUMBER_PATTERNS = (
+    re.compile(r'\*([A-Z]{1,3}\d{1,2}-\d{2}-\d{5})\*'),  # *C1-02-34567*
+    re.compile(r'([A-Z]{1,3}\d{1,2}-\d{2}-\d{5})'),     # C1-02-34567
+    re.compile(r'([A-Z]{3,5}\d{2}-\d{5})'),              # DBA01-23456
+    re.compile(r'([A-Z]{3,5}\d{6,7})'),                  # DBA0123456
+)
+
+
+class BillbeeCredentialError(Exception):
+    """
+    Billbee hat die Credentials abgelehnt bzw. sie konnten nicht geprüft werden.
+    Wird nur außerhalb des GUI-Threads ausgelöst, damit der Aufrufer die Meldung
+    im GUI-Thread anzeigen kann.
+    """
 
 
 class BillbeeAPI:
+    # Klassenweit, da label_generator pro Aktion eine neue Instanz erzeugt
+    _customer_id_cache = {}
+    _customer_id_lock = threading.Lock()
+    _etag_cache = OrderedDict()
+    _etag_lock = threading.Lock()
+
     def __init__(self, api_key: str, api_user: str, api_password: str, parent_widget=None):
         self.logger = get_module_logger("BillbeeAPI")
         self.base_url = "https://api.billbee.io/api/v1"
+        # Endpunkt-Vorlagen einmalig aufbauen
+        self._url_orders = self.base_url + "/orders"
+        self._url_search = self.base_url + "/search"
+        self._url_customer_addresses = self.base_url + "/customers/{}/addresses"
+        self._url_customer_orders = self.base_url + "/customers/{}/orders"
+        self._url_order_notes = self.base_url + "/orders/{}/notes"
         self.api_key = api_key
         self.api_user = api_user
         self.api_password = api_password
@@ -22,50 +92,104 @@ class BillbeeAPI:
         self.auth = (self.api_user, self.api_password)
         self.parent_widget = parent_widget  # Speichere das Parent-Widget für Popups
 
+        # Eine Session für alle Aufrufe, damit TCP/TLS-Verbindungen wiederverwendet werden
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.auth = self.auth
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Die Kundensuche ist ein POST, aber ohne Seiteneffekte
+                allowed_methods=["GET", "POST"],
+                respect_retry_after_header=True,
+                # Nach dem letzten Versuch die Antwort zurückgeben, damit die
+                # bestehende Statusbehandlung der Methoden greift
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+
+        # Die Credentials werden erst beim ersten echten API-Aufruf geprüft
+        self._credentials_checked = False
+        self._credentials_valid = False
+        self._credentials_error = None
+
         with LogBlock(self.logger, logging.INFO) as log:
             log("API Headers initialisiert")
             log("API Key geladen")
             log("Basic Auth geladen")
-            
-            # Überprüfe die Credentials
-            self._validate_credentials()
 
-    def _validate_credentials(self):
-        """Überprüft die API Credentials."""
+    def _ensure_authenticated(self) -> bool:
+        """
+        Prüft die Credentials vor dem ersten API-Aufruf dieser Instanz.
+        Gemerkt wird nur ein eindeutiges Ergebnis der Prüfung; scheitert sie
+        z. B. an einem Netzwerkfehler, wird beim nächsten Aufruf erneut geprüft.
+        """
+        if not self._credentials_checked:
+            valid, message = self._validate_credentials()
+            if valid is not None:
+                self._credentials_valid = valid
+                self._credentials_error = message
+                self._credentials_checked = True
+            if message:
+                self._show_credential_error(message)
+            return bool(valid)
+        if not self._credentials_valid:
+            self._show_credential_error(self._credentials_error)
+        return self._credentials_valid
+
+    def _validate_credentials(self) -> Tuple[Optional[bool], Optional[str]]:
+        """
+        Überprüft die API Credentials.
+        Liefert (gültig, Fehlermeldung); gültig ist None, wenn die Prüfung
+        selbst fehlgeschlagen ist und nichts über die Credentials aussagt.
+        """
         try:
             with LogBlock(self.logger, logging.INFO) as log:
                 log("Überprüfe Billbee API Credentials...")
                 
                 # Teste die Credentials mit einem einfachen API-Aufruf
-                test_response = requests.get(
-                    f"{self.base_url}/orders",
-                    headers=self.headers,
-                    auth=self.auth,
+                test_response = self.session.get(
+                    self._url_orders,
                     timeout=10
                 )
                 
                 if test_response.status_code == 200:
                     log("✅ Billbee API Credentials sind gültig")
-                    return True
+                    self.logger.debug(
+                        "Billbee Content-Encoding: %s",
+                        test_response.headers.get("Content-Encoding", "keine")
+                    )
+                    return True, None
                 elif test_response.status_code == 401:
                     self.logger.error("❌ Billbee API Credentials sind ungültig (401 Unauthorized)")
-                    self._show_credential_error("Billbee API Credentials sind ungültig. Bitte überprüfen Sie die Einstellungen in KeePass.")
-                    return False
+                    return False, "Billbee API Credentials sind ungültig. Bitte überprüfen Sie die Einstellungen in KeePass."
                 elif test_response.status_code == 403:
                     self.logger.error("❌ Billbee API Credentials haben keine Berechtigung (403 Forbidden)")
-                    self._show_credential_error("Billbee API Credentials haben keine Berechtigung. Bitte überprüfen Sie die API-Berechtigungen.")
-                    return False
+                    return False, "Billbee API Credentials haben keine Berechtigung. Bitte überprüfen Sie die API-Berechtigungen."
                 else:
                     self.logger.warning(f"⚠️ Unerwarteter API-Status: {test_response.status_code}")
-                    return True  # Trotzdem fortfahren
+                    return True, None  # Trotzdem fortfahren
                     
         except Exception as e:
             self.logger.error(f"Fehler beim Überprüfen der Billbee API Credentials: {str(e)}")
-            self._show_credential_error(f"Fehler beim Überprüfen der Billbee API Credentials: {str(e)}")
-            return False
+            return None, f"Fehler beim Überprüfen der Billbee API Credentials: {str(e)}"
 
     def _show_credential_error(self, message: str):
-        """Zeigt eine Fehlermeldung für Credential-Probleme an."""
+        """
+        Zeigt eine Fehlermeldung für Credential-Probleme an.
+        Außerhalb des GUI-Threads wird stattdessen BillbeeCredentialError ausgelöst.
+        """
+        app = QCoreApplication.instance()
+        if app is None:
+            self.logger.warning(f"Billbee API Fehler (ohne Dialog): {message}")
+            return
+        if QThread.currentThread() is not app.thread():
+            raise BillbeeCredentialError(message)
         try:
             if self.parent_widget:
                 LoggingMessageBox.critical(self.parent_widget, "Billbee API Fehler", message)
@@ -78,26 +202,36 @@ class BillbeeAPI:
         """
         Ruft die Kunden-ID basierend auf der E-Mail-Adresse ab.
         Wirft eine Exception, wenn mehrere Kunden zur gleichen E-Mail gefunden werden.
+        Gefundene Kunden-IDs werden für CUSTOMER_ID_CACHE_TTL Sekunden zwischengespeichert.
         """
+        cache_key = (self.api_key, email)
+        with self._customer_id_lock:
+            cached = self._customer_id_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < CUSTOMER_ID_CACHE_TTL:
+                self.logger.info(f"Kunden-ID für {email} aus Cache: {cached[1]}")
+                return cached[1]
+
+        if not self._ensure_authenticated():
+            return None
+
         try:
             with LogBlock(self.logger, logging.INFO) as log:
                 log(f"Suche Kunde anhand E-Mail: {email}")
                 
-                search_endpoint = f"{self.base_url}/search"
+                search_endpoint = self._url_search
                 search_payload = {
                     "type": ["customer"],
                     "term": f'email:"{email}"'
                 }
+                # Einmal serialisieren und die Bytes für Log und Request verwenden
+                search_body = _json_body(search_payload)
                 
-                log.section("API Anfrage")
-                log("Sende Suchanfrage:")
-                log(json.dumps(search_payload, indent=2))
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Sende Suchanfrage: %s", search_body.decode("utf-8"))
                 
-                response = requests.post(
+                response = self.session.post(
                     search_endpoint,
-                    headers=self.headers,
-                    auth=self.auth,
-                    json=search_payload,
+                    data=search_body,
                     timeout=30
                 )
                 
@@ -115,11 +249,10 @@ class BillbeeAPI:
                     return None
                 
                 response.raise_for_status()
-                data = response.json()
+                data = _json_loads(response.content)
                 
-                log.section("API Antwort")
-                log("Suchergebnis:")
-                log(json.dumps(data, indent=2))
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Suchergebnis: %s", _json_dumps(data))
 
                 customers = data.get("Customers", [])
                 if len(customers) > 1:
@@ -128,8 +261,10 @@ class BillbeeAPI:
                 elif len(customers) == 1:
                     customer_id = customers[0]["Id"]
                     log(f"Kunden-ID gefunden: {customer_id}")
+                    self._cache_customer_id(cache_key, customer_id)
                     return customer_id
                 else:
+                    # Nicht cachen: ein neu angelegter Kunde soll sofort gefunden werden
                     log("Keine Kunden-ID gefunden!")
                     return None
 
@@ -137,29 +272,67 @@ class BillbeeAPI:
             self.logger.error(f"Fehler beim Abrufen der Kunden-ID: {str(e)}")
             return None
 
+    def _cache_customer_id(self, cache_key, customer_id) -> None:
+        """Speichert ein Suchergebnis und verwirft bei Überlauf die ältesten Einträge."""
+        with self._customer_id_lock:
+            cache = self._customer_id_cache
+            cache.pop(cache_key, None)
+            cache[cache_key] = (time.monotonic(), customer_id)
+            while len(cache) > CUSTOMER_ID_CACHE_SIZE:
+                del cache[next(iter(cache))]
+
+    def _get_json(self, url: str, timeout: int = 30) -> Tuple[requests.Response, Optional[dict]]:
+        """
+        GET mit ETag-Cache. Liefert die Response und die geparsten Daten;
+        bei 304 Not Modified stammen die Daten aus dem Cache, bei Fehlerstatus ist data None.
+        Sendet der Server kein ETag, verhält sich die Methode wie ein normaler GET.
+        """
+        cache_key = (self.api_key, url)
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
+
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.session.get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and cached:
+            self.logger.info(f"Keine Änderungen seit letztem Abruf, verwende Cache: {url}")
+            with self._etag_lock:
+                self._etag_cache.move_to_end(cache_key)
+            return response, cached[1]
+        if response.status_code != 200:
+            return response, None
+
+        data = _json_loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[cache_key] = (etag, data)
+                self._etag_cache.move_to_end(cache_key)
+                while len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return response, data
+
     def get_all_customer_addresses(self, email: str) -> Optional[list]:
         """
         Ruft die Adressen des Kunden anhand seiner E-Mail-Adresse ab.
         Zuerst wird die Kunden-ID ermittelt und
         anschließend die zugehörigen Adressen abgerufen.
         """
-        with LogBlock(self.logger, logging.INFO) as log:
-            customer_id = self.get_customer_id(email)
-            if not customer_id:
-                log("Keine Adressen, da keine Kunden-ID gefunden wurde!")
-                return None
+        customer_id = self.get_customer_id(email)
+        if not customer_id:
+            self.logger.info("Keine Adressen, da keine Kunden-ID gefunden wurde!")
+            return None
+        return self._fetch_customer_addresses(customer_id)
 
+    def _fetch_customer_addresses(self, customer_id) -> Optional[list]:
+        """Ruft die Adressen zu einer bereits ermittelten Kunden-ID ab."""
+        with LogBlock(self.logger, logging.INFO) as log:
             log(f"Gefundene Kunden-ID: {customer_id}")
-            address_endpoint = f"{self.base_url}/customers/{customer_id}/addresses"
+            address_endpoint = self._url_customer_addresses.format(customer_id)
             log(f"Rufe Adressen ab von: {address_endpoint}")
             
             try:
-                address_response = requests.get(
-                    address_endpoint,
-                    headers=self.headers,
-                    auth=self.auth,
-                    timeout=30
-                )
+                address_response, address_data = self._get_json(address_endpoint)
                 
                 # Überprüfe den Response-Status
                 if address_response.status_code == 401:
@@ -168,22 +341,18 @@ class BillbeeAPI:
                 elif address_response.status_code == 403:
                     self.logger.error("Billbee API: 403 Forbidden - Keine Berechtigung")
                     return None
-                elif address_response.status_code != 200:
+                elif address_data is None:
                     self.logger.error(f"Billbee API: {address_response.status_code} - {address_response.text}")
                     return None
                 
-                address_response.raise_for_status()
-                address_data = address_response.json()
-                
-                log.section("API Antwort")
-                log("Gefundene Adressdaten:")
-                log(json.dumps(address_data, indent=2))
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Gefundene Adressdaten: %s", _json_dumps(address_data))
                 
-                if address_data.get("Data") and len(address_data["Data"]) > 0:
-                    addresses = sorted(address_data["Data"], key=lambda x: x["Id"], reverse=True)
-                    return addresses
-                log("Keine Adressen gefunden!")
-                return None
+                addresses = address_data.get("Data")
+                if not addresses:
+                    log("Keine Adressen gefunden!")
+                    return None
+                return sorted(addresses, key=itemgetter("Id"), reverse=True)
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"Fehler beim Abrufen der Kundenadressen: {str(e)}")
                 return None
@@ -207,21 +376,24 @@ class BillbeeAPI:
         if not customer_id:
             self.logger.info("Keine Bestellungen, da keine Kunden-ID gefunden wurde!")
             return None
+        return self._fetch_customer_orders(customer_id)
 
+    def _fetch_customer_orders(self, customer_id) -> Optional[list]:
+        """Ruft die Bestellungen zu einer bereits ermittelten Kunden-ID ab."""
         self.logger.info(f"Suche Bestellungen für Kunden-ID: {customer_id}")
-        orders_endpoint = f"{self.base_url}/customers/{customer_id}/orders"
+        orders_endpoint = self._url_customer_orders.format(customer_id)
         try:
-            response = requests.get(
-                orders_endpoint,
-                headers=self.headers,
-                auth=self.auth
-            )
-            response.raise_for_status()
-            orders_data = response.json()
-            self.logger.info(f"Gefundene Bestellungen: {json.dumps(orders_data, indent=2)}")
-            self.logger.info("-" * 80)
-            if orders_data.get("Data") and len(orders_data["Data"]) > 0:
-                return orders_data["Data"]
+            response, orders_data = self._get_json(orders_endpoint)
+            if orders_data is None:
+                response.raise_for_status()
+                self.logger.error(f"Billbee API: {response.status_code} - {response.text}")
+                return None
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Gefundene Bestellungen: %s", _json_dumps(orders_data))
+            self.logger.info(LOG_SEPARATOR)
+            orders = orders_data.get("Data")
+            if orders:
+                return orders
             else:
                 self.logger.info("Keine Bestellungen gefunden!")
                 return None
@@ -234,18 +406,13 @@ class BillbeeAPI:
         Extrahiert die Seriennummer aus den Notizen.
         Sucht nach Mustern wie *C1-02-34567, C1-02-34567 oder DBA01-23456.
         """
+        # Leere Notizen (oder None) gar nicht erst durch die Regex-Engine schicken
+        if not notes:
+            return None
+
         try:
-            import re
-            # Suche nach Seriennummern-Mustern
-            patterns = [
-                r'\*([A-Z]{1,3}\d{1,2}-\d{2}-\d{5})\*',  # *C1-02-34567*
-                r'([A-Z]{1,3}\d{1,2}-\d{2}-\d{5})',     # C1-02-34567
-                r'([A-Z]{3,5}\d{2}-\d{5})',              # DBA01-23456
-                r'([A-Z]{3,5}\d{6,7})',                  # DBA0123456
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, notes)
+            for pattern in SERIAL_NUMBER_PATTERNS:
+                match = pattern.search(notes)
                 if match:
                     return match.group(1)
             
@@ -258,18 +425,16 @@ class BillbeeAPI:
         """
         Ruft die Notizen zu einer Bestellung ab.
         """
+        if not self._ensure_authenticated():
+            return None
+
         with LogBlock(self.logger, logging.INFO) as log:
             log(f"Rufe Notizen für Bestellung {order_id} ab")
             
-            notes_endpoint = f"{self.base_url}/orders/{order_id}/notes"
+            notes_endpoint = self._url_order_notes.format(order_id)
             
             try:
-                response = requests.get(
-                    notes_endpoint,
-                    headers=self.headers,
-                    auth=self.auth,
-                    timeout=30
-                )
+                response, notes_data = self._get_json(notes_endpoint)
                 
                 # Überprüfe den Response-Status
                 if response.status_code == 401:
@@ -278,23 +443,17 @@ class BillbeeAPI:
                 elif response.status_code == 403:
                     self.logger.error("Billbee API: 403 Forbidden - Keine Berechtigung")
                     return None
-                elif response.status_code != 200:
+                elif notes_data is None:
                     self.logger.error(f"Billbee API: {response.status_code} - {response.text}")
                     return None
                 
-                response.raise_for_status()
-                notes_data = response.json()
-                
-                log.section("API Antwort")
-                log("Gefundene Notizen:")
-                log(json.dumps(notes_data, indent=2))
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Gefundene Notizen: %s", _json_dumps(notes_data))
                 
-                if notes_data.get("Data") and len(notes_data["Data"]) > 0:
+                notes = notes_data.get("Data")
+                if notes:
                     # Sammle alle Notizen
-                    all_notes = []
-                    for note in notes_data["Data"]:
-                        if note.get("Text"):
-                            all_notes.append(note["Text"])
+                    all_notes = [text for text in (note.get("Text") for note in notes) if text]
                     
                     combined_notes = "\n".join(all_notes)
                     log(f"Notizen erfolgreich abgerufen: {len(all_notes)} Notizen")
@@ -1,25 +1,46 @@
 import os
 import time
 import base64
+import hashlib
 import json
 import requests
 import sys
 import traceback
+from functools import partial
 from shared.utils.enhanced_logging import LoggingMessageBox, log_error_and_show_dialog
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QLineEdit, 
                             QPushButton, QFormLayout, QTextEdit, QMessageBox,
                             QInputDialog, QComboBox, QLabel, QHBoxLayout, QCheckBox, QDockWidget, QApplication)
-from PySide6.QtGui import QShortcut, QKeySequence
+from PySide6.QtGui import QShortcut, QKeySequence, QStandardItemModel, QStandardItem
 
 from .zendesk_api import get_customer_email, update_problem_description, update_serial_number, update_order_info
-from .billbee_api import BillbeeAPI
+from .billbee_api import BillbeeAPI, BillbeeCredentialError
 from shared.utils.unified_logger import get_logger
 from .preview_window import PreviewWindow
 from .dhl_api import DHLAPI as DHL_API_CLASS
 from .utils import validate_inputs, validate_reference_number
 from datetime import datetime
 
+# Kürzel der Sendungstypen in der DHL-Referenz
+REFERENCE_TYPE_CODES = {"Widerruf": "WR", "Reparatur": "Rep", "Test": "Test"}
+
+# Zendesk-Feld für Sendungsnummern; neue Nummern werden an den bisherigen Inhalt angehängt
+ZENDESK_TRACKING_FIELD_ID = 18851720152732
+
+ZENDESK_TICKET_URL = "https://ilockit.zendesk.com/api/v2/tickets/{}.json"
+
+# Timeout für Zendesk-Aufrufe (Verbindungsaufbau, Lesen) in Sekunden
+ZENDESK_TIMEOUT = (3.05, 10)
+
+# Blockgröße beim Dekodieren der Labels (Vielfaches von 4, damit jeder Block gültiges Base64 ist)
+LABEL_DECODE_CHUNK = 64 * 1024
+
+def _payload_hash(data) -> bytes:
+    """Prüfsumme einer API-Antwort, um unveränderte Listen zu erkennen."""
+    return hashlib.blake2b(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).digest()
+
+
 # Globaler Exception Handler
 def global_exception_handler(exctype, value, tb):
     """Globaler Exception Handler für unbehandelte Ausnahmen"""
@@ -58,6 +79,29 @@ def global_exception_handler(exctype, value, tb):
 # Setze den globalen Exception Handler
 sys.excepthook = global_exception_handler
 
+class _ApiWorkerSignals(QObject):
+    """Signale für API-Aufrufe im Hintergrund."""
+
+    result = Signal(object)
+    error = Signal(object)  # die ausgelöste Exception
+
+
+class _ApiWorker(QRunnable):
+    """Führt einen blockierenden API-Aufruf (Billbee/Zendesk) im Thread-Pool aus."""
+
+    def __init__(self, signals: _ApiWorkerSignals, fn, *args):
+        super().__init__()
+        self.signals = signals
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        try:
+            self.signals.result.emit(self.fn(*self.args))
+        except Exception as e:
+            self.signals.error.emit(e)
+
+
 class DHLLabelGenerator(QMainWindow):
     def __init__(self, parent=None):
         try:
@@ -82,6 +126,23 @@ class DHLLabelGenerator(QMainWindow):
             self.bb_api_password = None
             self.dhl_api = None
 
+            # Billbee-Client und Zendesk-Session werden wiederverwendet (Keep-Alive)
+            self._billbee = None
+            self._billbee_credentials = None
+            self._zd_session = requests.Session()
+            self._zd_headers = None
+            self._zd_auth_credentials = None
+
+            # Bestellnummer der im Dropdown ausgewählten Bestellung (für die Referenz)
+            self._selected_order_number = None
+
+            # Prüfsummen der zuletzt angezeigten Bestellungen/Adressen
+            self._orders_hash = None
+            self._addresses_hash = None
+
+            # Läuft gerade ein API-Abruf im Hintergrund?
+            self._fetch_running = False
+
             # Eingabefelder erstellen
             self.ticket_nr_input = QLineEdit()
             self.type_dropdown = QComboBox()
@@ -99,6 +160,8 @@ class DHLLabelGenerator(QMainWindow):
             #Gewichtsfeld hinzufügen
             self.weight_input = QLineEdit()
             self.weight_input.setPlaceholderText("1000")
+            self._weight_cache = None
+            self.weight_input.textChanged.connect(self._invalidate_weight_cache)
             
             # Problembeschreibungsfeld hinzufügen
             self.problem_description = QLineEdit()
@@ -113,7 +176,8 @@ class DHLLabelGenerator(QMainWindow):
             self.address_dropdown.currentIndexChanged.connect(self.on_address_selected)
             
             # Signal-Slot-Verbindung für dynamisches Update der Referenz:
-            self.ticket_nr_input.textChanged.connect(self.update_reference_field)
+            # (ohne den Text weiterzureichen, sonst landet er als Seriennummer in der Referenz)
+            self.ticket_nr_input.textChanged.connect(lambda: self.update_reference_field())
             
             # Bestellungen Dropdown
             self.orders_dropdown = QComboBox()
@@ -206,17 +270,27 @@ class DHLLabelGenerator(QMainWindow):
             # Füge den Button ins Layout ein
             layout.addWidget(self.preview_button)
             
-            # Vorschaufenster initial als None
-            self.preview_window = None
+            # Vorschaufenster direkt anlegen und nur ein-/ausblenden
+            self.preview_window = PreviewWindow()
+            self.preview_window.hide()
+
+            # Tastatureingaben bündeln: die Vorschau wird erst nach 150 ms Ruhe neu gezeichnet
+            self._preview_timer = QTimer(self)
+            self._preview_timer.setSingleShot(True)
+            self._preview_timer.setInterval(150)
+            self._preview_timer.timeout.connect(self._do_update_preview)
+
+            # Beim Verschieben des Hauptfensters die Vorschau höchstens alle 16 ms nachziehen
+            self._preview_position_timer = QTimer(self)
+            self._preview_position_timer.setSingleShot(True)
+            self._preview_position_timer.setInterval(16)
+            self._preview_position_timer.timeout.connect(self.update_preview_position)
 
             # Verbinde die relevanten Eingabefelder mit der Methode zum Aktualisieren der Vorschau
-            self.name_input.textChanged.connect(self.update_preview_content)
-            self.street_input.textChanged.connect(self.update_preview_content)
-            self.house_input.textChanged.connect(self.update_preview_content)
-            self.postal_input.textChanged.connect(self.update_preview_content)
-            self.city_input.textChanged.connect(self.update_preview_content)
-            self.ref_input.textChanged.connect(self.update_preview_content)
-            self.weight_input.textChanged.connect(self.update_preview_content)
+            for preview_input in (self.name_input, self.street_input, self.house_input,
+                                  self.postal_input, self.city_input, self.ref_input,
+                                  self.weight_input):
+                preview_input.textChanged.connect(self.update_preview_content)
             
             self.logger.info("Initialisierung abgeschlossen")
 
@@ -226,17 +300,12 @@ class DHLLabelGenerator(QMainWindow):
 
     def toggle_preview(self):
         """Öffnet oder schließt das Vorschaufenster und aktualisiert die Inhalte bei jedem Öffnen."""
-        if self.preview_window is None:
-            # Erstelle das Vorschaufenster
-            self.preview_window = PreviewWindow()
+        show = not self.preview_window.isVisible()
+        if show:
             self.update_preview_position()  # Positioniere das Fenster rechts vom Hauptfenster
-        self.update_preview_content()  # Aktualisiere die Vorschauinhalte direkt beim Öffnen
-        if not self.preview_window.isVisible():
-            self.preview_window.show()
-            self.preview_button.setText("Vorschau ausblenden")
-        else:
-            self.preview_window.hide()
-            self.preview_button.setText("Vorschau anzeigen")
+            self._do_update_preview()  # Aktualisiere die Vorschauinhalte direkt beim Öffnen
+        self.preview_window.setVisible(show)
+        self.preview_button.setText("Vorschau ausblenden" if show else "Vorschau anzeigen")
             
     def closeEvent(self, event):
         if self.preview_window is not None:
@@ -247,7 +316,9 @@ class DHLLabelGenerator(QMainWindow):
         """Wird ausgelöst, wenn das Hauptfenster bewegt wird."""
         super().moveEvent(event)
         if self.preview_window and self.preview_window.isVisible():
-            self.update_preview_position()
+            # Läuft der Timer schon, wird die neue Position beim nächsten Tick übernommen
+            if not self._preview_position_timer.isActive():
+                self._preview_position_timer.start()
 
     def update_preview_position(self):
         """Positioniert das Vorschaufenster rechts vom Hauptfenster."""
@@ -258,6 +329,13 @@ class DHLLabelGenerator(QMainWindow):
             self.preview_window.move(x, y)
     
     def update_preview_content(self):
+        """Plant eine Aktualisierung der Vorschau; schnelle Eingaben werden zusammengefasst."""
+        # Ausgeblendete Vorschau nicht neu zeichnen; toggle_preview rendert beim Öffnen ohnehin
+        if not self.preview_window.isVisible():
+            return
+        self._preview_timer.start()
+
+    def _do_update_preview(self):
         """Sammelt Eingabedaten und aktualisiert die Vorschau."""
         if self.preview_window:
             # Absenderadresse aus den Eingabefeldern (Name, Straße, Hausnummer, PLZ, Stadt)
@@ -267,18 +345,8 @@ class DHLLabelGenerator(QMainWindow):
 
             reference = self.ref_input.text().strip()
             
-            # Gewicht aus dem Eingabefeld
-            weight_gram = self.weight_input.text().strip()
-            if not weight_gram:
-                weight_gram = 1000  # Standardgewicht in Gramm verwenden
-            else:
-                try:
-                    weight_gram = int(weight_gram)
-                except ValueError:
-                    weight_gram = 1000  # Fallback auf Standardgewicht bei ungültiger Eingabe
-
-            # Umrechnung in Kilogramm
-            weight_kg = weight_gram / 1000
+            # Gewicht aus dem Eingabefeld, umgerechnet in Kilogramm
+            weight_kg = self._current_weight_g() / 1000
 
             text_data = {
                 "sender": sender,
@@ -289,6 +357,23 @@ class DHLLabelGenerator(QMainWindow):
             # Aktualisiere die Vorschau im Fenster
             self.preview_window.update_preview(text_data)
             
+    def _invalidate_weight_cache(self):
+        self._weight_cache = None
+
+    def _current_weight_g(self):
+        """
+        Gewicht in Gramm aus dem Eingabefeld; leer oder ungültig ergibt das
+        Standardgewicht von 1000 g. Der Wert wird bis zur nächsten Änderung
+        des Feldes zwischengespeichert.
+        """
+        if self._weight_cache is None:
+            weight_text = self.weight_input.text().strip()
+            try:
+                self._weight_cache = int(weight_text) if weight_text else 1000
+            except ValueError:
+                self._weight_cache = 1000  # Fallback auf Standardgewicht bei ungültiger Eingabe
+        return self._weight_cache
+
     def trigger_fetch_action(self):
         """
         Löst den Klick des Kombinationsbuttons aus,
@@ -305,12 +390,10 @@ class DHLLabelGenerator(QMainWindow):
             self.generate_button.setEnabled(False)
             self.email_button.setEnabled(False)
             self.logger.info("Buttons deaktiviert, bitte einen Typ auswählen")
-            self.logger.info("-" * 80)
         else:
             self.generate_button.setEnabled(True)
-            self.email_button.setEnabled(True)
+            self.email_button.setEnabled(not self._fetch_running)
             self.logger.info("Typ ausgewählt, Buttons aktiviert")
-            self.logger.info("-" * 80)
     
     def fetch_orders(self):
         email = self.email_input.text().strip()
@@ -318,64 +401,123 @@ class DHLLabelGenerator(QMainWindow):
             LoggingMessageBox.warning(self, "Fehler", "Bitte eine E-Mail-Adresse eingeben.")
             return
 
-        try:
-            billbee = BillbeeAPI(
-                api_key=self.bb_api_key,
-                api_user=self.bb_api_user,
-                api_password=self.bb_api_password,
-                parent_widget=self  # Übergebe das Hauptfenster als Parent-Widget
-            )
-            orders = billbee.get_all_customer_orders(email)
+        billbee = self._get_billbee()
+        self._run_in_background(
+            billbee.get_all_customer_orders,
+            partial(self._populate_orders_dropdown, billbee),
+            self._on_fetch_orders_failed,
+            email
+        )
 
-            self.orders_dropdown.clear()
-            self.orders_dropdown.addItem("- Bitte auswählen -")
-            
-            if orders:
-                for order in orders:
-                    order_number = order.get("OrderNumber", "Unbekannt")
-                    weight_kg = order.get("ShipWeightKg")
-                    
-                    if weight_kg is not None:
-                        weight_gram = int(float(weight_kg) * 1000)
-                        order_text = (
-                            f"Bestellnummer: {order_number} - "
-                            f"Gewicht: {weight_gram}g"
-                        )
-                    else:
-                        order_text = f"Bestellnummer: {order_number}"
-
-                    # Extrahiere die Seriennummer aus den Notizen
-                    notes = order.get("SellerComment", "")
-                    if notes:
-                        serial_number = billbee.extract_serial_number(notes)
-                        if serial_number:
-                            order_text += f" - Seriennummer: {serial_number}"
-
-                    self.orders_dropdown.addItem(order_text, order)
-                    
-                self.logger.info(f"{len(orders)} Bestellungen erfolgreich geladen")
-                self.logger.info("-" * 80)
+    def _populate_orders_dropdown(self, billbee, orders):
+        """Befüllt das Bestellungen-Dropdown (läuft im GUI-Thread)."""
+        # Gleiche Bestellungen wie beim letzten Abruf: Dropdown und Auswahl unverändert lassen
+        orders_hash = _payload_hash(orders) if orders else None
+        if orders_hash is not None and orders_hash == self._orders_hash:
+            self.logger.info(f"{len(orders)} Bestellungen unverändert, Dropdown bleibt bestehen")
+            self._flash_orders_dropdown()
+            return
+        self._orders_hash = orders_hash
+
+        self.orders_dropdown.clear()
+        self.orders_dropdown.addItem("- Bitte auswählen -")
+        
+        if orders:
+            order_texts = []
+            for order in orders:
+                order_number = order.get("OrderNumber", "Unbekannt")
+                weight_kg = order.get("ShipWeightKg")
                 
-                # Dropdown kurz grün aufleuchten lassen
-                self.orders_dropdown.setStyleSheet("background-color: lightgreen;")
-                QTimer.singleShot(
-                    2000, 
-                    lambda: self.orders_dropdown.setStyleSheet("")
-                )
-            else:
-                LoggingMessageBox.warning(self, "Fehler", "Keine Bestellungen gefunden.")
-                self.logger.info("Keine Bestellungen gefunden")
-                self.logger.info("-" * 80)
+                if weight_kg is not None:
+                    weight_gram = int(float(weight_kg) * 1000)
+                    order_text = (
+                        f"Bestellnummer: {order_number} - "
+                        f"Gewicht: {weight_gram}g"
+                    )
+                else:
+                    order_text = f"Bestellnummer: {order_number}"
+
+                # Extrahiere die Seriennummer aus den Notizen
+                notes = order.get("SellerComment", "")
+                if notes:
+                    serial_number = billbee.extract_serial_number(notes)
+                    if serial_number:
+                        order_text += f" - Seriennummer: {serial_number}"
+
+                order_texts.append(order_text)
+
+            # Alle Einträge in einem Schritt einfügen und erst danach die Daten setzen
+            self.orders_dropdown.blockSignals(True)
+            try:
+                self.orders_dropdown.addItems(order_texts)
+                for row, order in enumerate(orders, start=1):
+                    self.orders_dropdown.setItemData(row, order)
+            finally:
+                self.orders_dropdown.blockSignals(False)
                 
-        except Exception as e:
-            LoggingMessageBox.warning(self, "Fehler", f"Fehler beim Abrufen der Bestellungen: {str(e)}"
-            )
+            self.logger.info(f"{len(orders)} Bestellungen erfolgreich geladen")
+            
+            self._flash_orders_dropdown()
+        else:
+            LoggingMessageBox.warning(self, "Fehler", "Keine Bestellungen gefunden.")
+            self.logger.info("Keine Bestellungen gefunden")
+
+    def _flash_orders_dropdown(self):
+        """Lässt das Bestellungen-Dropdown kurz grün aufleuchten."""
+        self.orders_dropdown.setStyleSheet("background-color: lightgreen;")
+        QTimer.singleShot(
+            2000, 
+            lambda: self.orders_dropdown.setStyleSheet("")
+        )
+
+    def _on_fetch_orders_failed(self, error):
+        LoggingMessageBox.warning(self, "Fehler", f"Fehler beim Abrufen der Bestellungen: {error}")
+
+    def _run_in_background(self, fn, on_result, on_error, *args):
+        """
+        Führt einen blockierenden API-Aufruf im globalen Thread-Pool aus.
+        Ergebnis und Fehler kommen per Signal im GUI-Thread an; solange der
+        Aufruf läuft, sind die Abruf-Buttons gesperrt.
+        """
+        if self._fetch_running:
+            self.logger.info("Es läuft bereits ein Abruf, bitte warten")
+            return
+
+        signals = _ApiWorkerSignals(self)
+        signals.result.connect(partial(self._on_background_done, signals, on_result))
+        signals.error.connect(
+            partial(self._on_background_done, signals, partial(self._on_background_failed, on_error))
+        )
+        self._set_fetch_running(True)
+        QThreadPool.globalInstance().start(_ApiWorker(signals, fn, *args))
+
+    def _on_background_done(self, signals, callback, value):
+        self._set_fetch_running(False)
+        signals.deleteLater()
+        callback(value)
+
+    def _on_background_failed(self, on_error, error):
+        """Abgelehnte Billbee-Credentials werden einheitlich gemeldet, alle anderen Fehler an on_error."""
+        if isinstance(error, BillbeeCredentialError):
+            LoggingMessageBox.critical(self, "Billbee API Fehler", str(error))
+        else:
+            on_error(str(error))
+
+    def _set_fetch_running(self, running):
+        """Sperrt die Abruf-Buttons während eines Hintergrund-Abrufs gegen Mehrfachklicks."""
+        self._fetch_running = running
+        self.address_button.setEnabled(not running)
+        # Der Kombinationsbutton ist zusätzlich an die Typ-Auswahl gebunden
+        type_selected = self.type_dropdown.currentText() != "- Bitte auswählen -"
+        self.email_button.setEnabled(not running and type_selected)
 
     def on_order_selected(self, index):
-        if index == 0:  # Platzhalter ignorieren
+        if index <= 0:  # Platzhalter bzw. geleertes Dropdown ignorieren
+            self._selected_order_number = None
             return
 
         selected_order = self.orders_dropdown.itemData(index)
+        self._selected_order_number = selected_order.get("OrderNumber") if selected_order else None
         if selected_order:
             # Adressdaten aus der Bestellung laden
             shipping_address = selected_order.get("ShippingAddress", {})
@@ -428,15 +570,7 @@ class DHLLabelGenerator(QMainWindow):
             # Extrahiere die Seriennummer aus den Notizen
             notes = selected_order.get("SellerComment", "")
             if notes:
-                # Initialisiere die Billbee-API falls noch nicht geschehen
-                if not hasattr(self, 'bb_api') or self.bb_api is None:
-                    self.bb_api = BillbeeAPI(
-                        api_key=self.bb_api_key,
-                        api_user=self.bb_api_user,
-                        api_password=self.bb_api_password
-                    )
-                
-                serial_number = self.bb_api.extract_serial_number(notes)
+                serial_number = self._get_billbee().extract_serial_number(notes)
                 if serial_number:
                     self.logger.info(f"Seriennummer gefunden: {serial_number}")
                     # Aktualisiere das Referenzfeld mit der Seriennummer
@@ -451,21 +585,25 @@ class DHLLabelGenerator(QMainWindow):
     def get_zendesk_email(self):
         ticket_id = self.ticket_nr_input.text()
         if ticket_id:
-            try:
-                email = get_customer_email(ticket_id, self.zendesk_email, self.zendesk_token)
-                if email:
-                    self.email_input.setText(email)
-                    self.logger.info(f"E-Mail für Ticket {ticket_id} erfolgreich abgerufen: {email}")
-                    self.logger.info("-" * 80)
-                else:
-                    LoggingMessageBox.warning(self, "Fehler", "E-Mail-Adresse konnte nicht gefunden werden")
-            except Exception as e:
-                LoggingMessageBox.warning(self, "Fehler", str(e))
-                self.logger.error(f"Fehler beim Abrufen der E-Mail: {str(e)}")
-                self.logger.info("-" * 80)
+            self._run_in_background(
+                get_customer_email,
+                partial(self._on_zendesk_email_fetched, ticket_id),
+                self._on_zendesk_email_failed,
+                ticket_id, self.zendesk_email, self.zendesk_token
+            )
         else:
             LoggingMessageBox.warning(self, "Fehler", "Bitte eine Ticket-Nr. eingeben")
-            self.logger.info("-" * 80)
+
+    def _on_zendesk_email_fetched(self, ticket_id, email):
+        if email:
+            self.email_input.setText(email)
+            self.logger.info(f"E-Mail für Ticket {ticket_id} erfolgreich abgerufen: {email}")
+        else:
+            LoggingMessageBox.warning(self, "Fehler", "E-Mail-Adresse konnte nicht gefunden werden")
+
+    def _on_zendesk_email_failed(self, error):
+        LoggingMessageBox.warning(self, "Fehler", error)
+        self.logger.error(f"Fehler beim Abrufen der E-Mail: {error}")
 
     def handle_email_enter(self):
         """Behandelt Enter-Taste im E-Mail-Feld"""
@@ -486,33 +624,44 @@ class DHLLabelGenerator(QMainWindow):
             LoggingMessageBox.warning(self, "Fehler", "Bitte eine E-Mail-Adresse eingeben")
             return
             
-        try:
-            billbee = BillbeeAPI(
-                api_key=self.bb_api_key,
-                api_user=self.bb_api_user,
-                api_password=self.bb_api_password,
-                parent_widget=self  # Übergebe das Hauptfenster als Parent-Widget
-            )
-            addresses = billbee.get_all_customer_addresses(email)
-            
+        billbee = self._get_billbee()
+        self._run_in_background(
+            billbee.get_all_customer_addresses,
+            self._populate_address_dropdown,
+            self._on_billbee_address_failed,
+            email
+        )
+
+    def _populate_address_dropdown(self, addresses):
+        """Befüllt das Adress-Dropdown (läuft im GUI-Thread)."""
+        addresses_hash = _payload_hash(addresses) if addresses else None
+        if addresses_hash is not None and addresses_hash == self._addresses_hash:
+            self.logger.info("Adressen unverändert, Dropdown bleibt bestehen")
+            return
+        self._addresses_hash = addresses_hash
+
+        if addresses:
+            # Modell vollständig aufbauen und einmalig setzen statt jede Zeile
+            # einzeln einzufügen; das alte Modell gibt die ComboBox selbst frei
+            model = QStandardItemModel(self.address_dropdown)
+            for addr in addresses:
+                street = addr.get("Street", "")
+                housenumber = addr.get("Housenumber", "")
+                city = addr.get("City", "")
+                item = QStandardItem(f"{street} {housenumber}, {city}")
+                # Speichere das komplette Address-Dictionary als "userData" im Combo-Box-Item
+                item.setData(addr, Qt.UserRole)
+                model.appendRow(item)
+            self.address_dropdown.setModel(model)
+
+            self.logger.info("Adressen von Billbee erfolgreich geladen. Bitte wählen Sie eine Adresse aus.")
+        else:
             self.address_dropdown.clear()
-            
-            if addresses:
-                # Fülle das Dropdown mit einer kompakten Darstellung:
-                for addr in addresses:
-                    street = addr.get("Street", "")
-                    housenumber = addr.get("Housenumber", "")
-                    city = addr.get("City", "")
-                    display_text = f"{street} {housenumber}, {city}"
-                    # Speichere das komplette Address-Dictionary als "userData" im Combo-Box-Item
-                    self.address_dropdown.addItem(display_text, addr)
-
-                self.logger.info("Adressen von Billbee erfolgreich geladen. Bitte wählen Sie eine Adresse aus.")
-            else:
-                LoggingMessageBox.warning(self, "Fehler", "Keine Kundendaten gefunden")
-        except Exception as e:
-            LoggingMessageBox.warning(self, "Fehler", str(e))
-            self.logger.error(f"Fehler beim Laden der Adressdaten: {str(e)}")
+            LoggingMessageBox.warning(self, "Fehler", "Keine Kundendaten gefunden")
+
+    def _on_billbee_address_failed(self, error):
+        LoggingMessageBox.warning(self, "Fehler", error)
+        self.logger.error(f"Fehler beim Laden der Adressdaten: {error}")
 
     def fetch_customer_data(self) -> None:
         """
@@ -531,30 +680,33 @@ class DHLLabelGenerator(QMainWindow):
             LoggingMessageBox.warning(self, "Fehler", "Bitte eine Ticket-Nr. eingeben")
             return
 
-        # Abruf der E-Mail-Adresse über Zendesk
-        try:
-            self.logger.info(f"Versuche E-Mail-Adresse für Ticket {ticket_id} abzurufen")
-            self.logger.info("-" * 80)
-            email = get_customer_email(ticket_id, self.zendesk_email, self.zendesk_token)
-            if not email:
-                LoggingMessageBox.warning(self, "Fehler", f"Keine E-Mail-Adresse zu Ticket #{ticket_id} gefunden")
-                self.logger.info(f"Keine E-Mail-Adresse zu Ticket {ticket_id} gefunden")
-                self.logger.info("-" * 80)
-                return
-            self.email_input.setText(email)
-            self.logger.info(
-                f"E-Mail-Adresse für Ticket {ticket_id} erfolgreich abgerufen: {email}"
-            )
-            self.logger.info("-" * 80)
-        except Exception as e:
-            LoggingMessageBox.warning(self, "Fehler", f"Fehler beim Abrufen der E-Mail: {str(e)}")
-            self.logger.error(f"Fehler beim Abrufen der E-Mail: {str(e)}")
-            self.logger.info("-" * 80)
+        # Abruf der E-Mail-Adresse über Zendesk; die Bestellungen werden erst
+        # abgerufen, wenn die E-Mail-Adresse vorliegt
+        self.logger.info(f"Versuche E-Mail-Adresse für Ticket {ticket_id} abzurufen")
+        self._run_in_background(
+            get_customer_email,
+            partial(self._on_customer_email_fetched, ticket_id),
+            self._on_customer_email_failed,
+            ticket_id, self.zendesk_email, self.zendesk_token
+        )
+
+    def _on_customer_email_fetched(self, ticket_id, email):
+        if not email:
+            LoggingMessageBox.warning(self, "Fehler", f"Keine E-Mail-Adresse zu Ticket #{ticket_id} gefunden")
+            self.logger.info(f"Keine E-Mail-Adresse zu Ticket {ticket_id} gefunden")
             return
+        self.email_input.setText(email)
+        self.logger.info(
+            f"E-Mail-Adresse für Ticket {ticket_id} erfolgreich abgerufen: {email}"
+        )
         
         # Abruf der Bestellungen aus Billbee basierend auf der abgerufenen E-Mail
         self.fetch_orders()
 
+    def _on_customer_email_failed(self, error):
+        LoggingMessageBox.warning(self, "Fehler", f"Fehler beim Abrufen der E-Mail: {error}")
+        self.logger.error(f"Fehler beim Abrufen der E-Mail: {error}")
+
     def update_reference_field(self, serial_number=None):
         """
         Aktualisiert das Referenzfeld dynamisch basierend auf der Ticketnummer,
@@ -568,31 +720,21 @@ class DHLLabelGenerator(QMainWindow):
             self.ref_input.setText("")
             return
 
-        # Bestimme den Typ-Code basierend auf dem ausgewählten Typ
+        # Bestimme den Typ-Code; unbekannte Typen werden direkt übernommen
+        typ = REFERENCE_TYPE_CODES.get(typ_text, typ_text)
         if typ_text == "Widerruf":
-            typ = "WR"
-            # Hole die Bestellnummer aus dem ausgewählten Bestellungs-Dropdown
-            order_index = self.orders_dropdown.currentIndex()
-            if order_index > 0:  # Wenn eine Bestellung ausgewählt ist (nicht der Platzhalter)
-                selected_order = self.orders_dropdown.itemData(order_index)
-                if selected_order and "OrderNumber" in selected_order:
-                    order_number = selected_order["OrderNumber"]
-                    # Baue die Referenz mit Seriennummer
-                    if serial_number:
-                        reference = f"#{ticket} {typ} {order_number} {serial_number}"
-                    else:
-                        reference = f"#{ticket} {typ} {order_number}"
-                    # Prüfe, ob die Gesamtlänge unter 35 Zeichen liegt (DHL Limit)
-                    if len(reference) <= 35:
-                        self.ref_input.setText(reference)
-                        return
-        elif typ_text == "Reparatur":
-            typ = "Rep"
-        elif typ_text == "Test":
-            typ = "Test"
-        else:
-            # Verwende den Text direkt, ohne weitere Verarbeitung
-            typ = typ_text
+            # Bestellnummer der ausgewählten Bestellung (wird in on_order_selected gesetzt)
+            order_number = self._selected_order_number
+            if order_number is not None:
+                # Baue die Referenz mit Seriennummer
+                if serial_number:
+                    reference = f"#{ticket} {typ} {order_number} {serial_number}"
+                else:
+                    reference = f"#{ticket} {typ} {order_number}"
+                # Prüfe, ob die Gesamtlänge unter 35 Zeichen liegt (DHL Limit)
+                if len(reference) <= 35:
+                    self.ref_input.setText(reference)
+                    return
 
         # Baue die Referenz mit Seriennummer
         if serial_number:
@@ -631,6 +773,23 @@ class DHLLabelGenerator(QMainWindow):
             if address.get("Company"):
                 self.additional_info_input.setText(address.get("Company"))
 
+    def _get_billbee(self):
+        """
+        Liefert den gemeinsamen Billbee-Client, damit Session und Verbindungen
+        über mehrere Abrufe erhalten bleiben. Wird neu erstellt, wenn sich die
+        Zugangsdaten geändert haben.
+        """
+        credentials = (self.bb_api_key, self.bb_api_user, self.bb_api_password)
+        if self._billbee is None or self._billbee_credentials != credentials:
+            self._billbee = BillbeeAPI(
+                api_key=self.bb_api_key,
+                api_user=self.bb_api_user,
+                api_password=self.bb_api_password,
+                parent_widget=self  # Übergebe das Hauptfenster als Parent-Widget
+            )
+            self._billbee_credentials = credentials
+        return self._billbee
+
     def initialize_dhl_api(self):
         if not hasattr(self, 'dhl_api') or self.dhl_api is None:
             self.logger.info("Initialisiere DHL API")
@@ -645,6 +804,21 @@ class DHLLabelGenerator(QMainWindow):
             self.logger.info("DHL Zugangsdaten geladen")
             self.logger.info("DHL Client Credentials geladen")
     
+    def _zendesk_headers(self):
+        """
+        Liefert die Request-Header (Basic-Auth, JSON) für Zendesk. Werden nur
+        neu aufgebaut, wenn sich E-Mail oder Token geändert haben.
+        """
+        credentials = (self.zendesk_email, self.zendesk_token)
+        if self._zd_auth_credentials != credentials:
+            auth_string = f"{self.zendesk_email}/token:{self.zendesk_token}"
+            self._zd_headers = {
+                "Authorization": "Basic " + base64.b64encode(auth_string.encode()).decode(),
+                "Content-Type": "application/json"
+            }
+            self._zd_auth_credentials = credentials
+        return self._zd_headers
+
     def update_zendesk_ticket_fields(self, ticket_id, fields_update):
         """
         Aktualisiert mehrere Zendesk-Ticketfelder in einem API-Aufruf.
@@ -654,14 +828,9 @@ class DHLLabelGenerator(QMainWindow):
         :return: True bei Erfolg, sonst False
         """
         try:
-            auth_string = f"{self.zendesk_email}/token:{self.zendesk_token}"
-            encoded_auth = base64.b64encode(auth_string.encode()).decode()
-            headers = {
-                "Authorization": f"Basic {encoded_auth}",
-                "Content-Type": "application/json"
-            }
-            url = f"https://ilockit.zendesk.com/api/v2/tickets/{ticket_id}.json"
-            response = requests.get(url, headers=headers)
+            headers = self._zendesk_headers()
+            url = ZENDESK_TICKET_URL.format(ticket_id)
+            response = self._zd_session.get(url, headers=headers, timeout=ZENDESK_TIMEOUT)
             response.raise_for_status()
             ticket_data = response.json()
 
@@ -671,24 +840,22 @@ class DHLLabelGenerator(QMainWindow):
                 for field in ticket_data["ticket"]["custom_fields"]
             }
 
-            new_fields = []
-            for field_id, new_value in fields_update.items():
-                # Beim Tracking-Feld wird der neue Wert angehängt
-                if field_id == 18851720152732:
-                    current_value = current_fields.get(field_id, "")
-                    if current_value.strip():
-                        combined_value = f"{current_value.strip()}\n{new_value}"
-                    else:
-                        combined_value = f"{new_value}"
-                    new_fields.append({"id": field_id, "value": combined_value})
-                # Beim Bestellnamen-Feld wird der Wert direkt gesetzt
-                elif field_id == 7566313720220:
-                    new_fields.append({"id": field_id, "value": new_value})
-                else:
-                    new_fields.append({"id": field_id, "value": new_value})
+            def merged_value(field_id, new_value):
+                # Beim Tracking-Feld wird der neue Wert angehängt, alle anderen werden direkt gesetzt
+                if field_id == ZENDESK_TRACKING_FIELD_ID:
+                    current_value = current_fields.get(field_id, "").strip()
+                    if current_value:
+                        return f"{current_value}\n{new_value}"
+                    return f"{new_value}"
+                return new_value
+
+            new_fields = [
+                {"id": field_id, "value": merged_value(field_id, new_value)}
+                for field_id, new_value in fields_update.items()
+            ]
 
             update_data = {"ticket": {"custom_fields": new_fields}}
-            response = requests.put(url, json=update_data, headers=headers)
+            response = self._zd_session.put(url, json=update_data, headers=headers, timeout=ZENDESK_TIMEOUT)
             response.raise_for_status()
             self.logger.info(f"Zendesk Update erfolgreich: {response.status_code}")
             return True
@@ -701,19 +868,29 @@ class DHLLabelGenerator(QMainWindow):
         """Speichert das Label als PDF-Datei im Labels Ordner."""
         try:
             # Erstelle den Labels Ordner, falls er nicht existiert
-            if not os.path.exists("Labels"):
-                os.makedirs("Labels")
+            os.makedirs("Labels", exist_ok=True)
             
             # Erstelle den Dateinamen
             filename = f"{sender_name}_{reference}.pdf"
             filepath = os.path.join("Labels", filename)
             
-            # Konvertiere Base64 in Bytes
-            label_bytes = base64.b64decode(label_b64)
-            
-            # Speichere das Label
-            with open(filepath, "wb") as f:
-                f.write(label_bytes)
+            # Zeilenumbrüche entfernen, sonst verschiebt sich die 4er-Ausrichtung der Blöcke
+            label_b64 = "".join(label_b64.split())
+
+            # Base64 blockweise dekodieren und in eine temporäre Datei schreiben;
+            # erst nach vollständiger Dekodierung unter dem endgültigen Namen ablegen
+            temp_path = filepath + ".part"
+            try:
+                with open(temp_path, "wb") as f:
+                    for start in range(0, len(label_b64), LABEL_DECODE_CHUNK):
+                        f.write(base64.b64decode(
+                            label_b64[start:start + LABEL_DECODE_CHUNK], validate=True
+                        ))
+                os.replace(temp_path, filepath)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
             
             self.logger.info(f"Label gespeichert als {filepath}")
             return filepath
@@ -830,7 +1007,7 @@ class DHLLabelGenerator(QMainWindow):
                         # Extrahiere die Seriennummer aus den Notizen
                         notes = selected_order.get("SellerComment", "")
                         if notes:
-                            serial_number = self.bb_api.extract_serial_number(notes)
+                            serial_number = self._get_billbee().extract_serial_number(notes)
                             if serial_number:
                                 # Aktualisiere das Seriennummer-Feld im Zendesk-Ticket
                                 if update_serial_number(ticket_id, self.zendesk_email, self.zendesk_token, serial_number):
@@ -860,7 +1037,7 @@ class DHLLabelGenerator(QMainWindow):
                             self.logger.info("Fehler beim Aktualisieren der Bestellinformationen im Zendesk-Ticket")
 
                 fields_update = {
-                    18851720152732: shipment_no,  # Trackingnummer
+                    ZENDESK_TRACKING_FIELD_ID: shipment_no,  # Trackingnummer
                     7566313720220: self.name_input.text().strip()    # Bestellname
                 }
                 if self.update_zendesk_ticket_fields(ticket_id, fields_update):
@@ -905,6 +1082,7 @@ class DHLLabelGenerator(QMainWindow):
         self.problem_description.clear()
         self.orders_dropdown.setCurrentIndex(0)
         self.address_dropdown.clear()
+        self._addresses_hash = None
 
     def load_api_credentials(self, master_password):
         """Lädt die API-Credentials aus der Keepass-Datei."""
@@ -2,6 +2,8 @@ import os
 import sys
 import traceback
 import logging
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from shared.credentials.credential_cache import get_credential_cache
 from shared.credentials.keepass_handler import CentralKeePassHandler
 from modules.dhl_label_tool.label_generator import DHLLabelGenerator
@@ -26,6 +28,7 @@ def show_error_message(message):
     error_dialog.setText(message)
     error_dialog.exec()
 
+@lru_cache(maxsize=1)
 def get_database_path():
     # Verwende die zentrale KeePass-Datenbank
     if getattr(sys, "frozen", False):
@@ -42,11 +45,64 @@ def get_database_path():
         base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         return os.path.join(base_path, "credentials.kdbx")
 
+@lru_cache(maxsize=1)
+def load_stylesheet():
+    """
+    Liest das Stylesheet aus den Qt-Ressourcen einmalig und cached den Inhalt.
+    Schlägt das Lesen fehl, wird OSError ausgelöst (und nichts gecached).
+    """
+    qss_file = QFile(":/global_style.qss")
+    if not qss_file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
+        raise OSError(f"Stylesheet konnte nicht geöffnet werden: {qss_file.errorString()}")
+    try:
+        return str(qss_file.readAll(), encoding="utf-8")
+    finally:
+        qss_file.close()
+
 def get_style_path():
     # Verwende das globale I LOCK IT Stylesheet
     base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     return os.path.join(base_path, "global_style.qss")
 
+# KeePass-Einträge des DHL Label Tools:
+# (Gruppe, Titel, Attribut für Username, Attribut für Passwort, Bezeichnung für Fehlermeldungen)
+DHL_CREDENTIALS = (
+    ("DHL Label Tool", "DHL API Zugangsdaten", "username", "password",
+     "DHL API Zugangsdaten (Username/Password)"),
+    ("DHL Label Tool", "DHL Client Credentials", "client_id", "client_secret",
+     "DHL Client Credentials (ID/Secret)"),
+    ("shared", "Zendesk API Token", "zendesk_email", "zendesk_token",
+     "Zendesk API Zugangsdaten (Email/Token)"),
+    ("shared", "BillBee API Key", None, "bb_api_key",
+     "Billbee API Key"),
+    ("shared", "BillBee Basic Auth", "bb_api_user", "bb_api_password",
+     "Billbee Basic Auth Daten"),
+    ("DHL Label Tool", "DHL Billing", "billing_number", None,
+     "DHL Billing Number"),
+)
+
+def load_dhl_credentials(kp_handler: CentralKeePassHandler) -> Tuple[Dict[str, Optional[str]], List[str]]:
+    """Lädt alle Zugangsdaten des DHL Label Tools in einem Durchlauf.
+
+    Returns:
+        Tuple aus {Attributname: Wert} für das Hauptfenster und der Liste
+        der Bezeichnungen unvollständiger Einträge.
+    """
+    creds = kp_handler.get_credentials_batch(
+        (group, title) for group, title, *_ in DHL_CREDENTIALS
+    )
+    values: Dict[str, Optional[str]] = {}
+    missing: List[str] = []
+    for group, title, user_attr, password_attr, description in DHL_CREDENTIALS:
+        username, password = creds[(group, title)]
+        for attr, value in ((user_attr, username), (password_attr, password)):
+            if attr is None:
+                continue
+            values[attr] = value
+            if not value and description not in missing:
+                missing.append(description)
+    return values, missing
+
 def start_dhl_label_tool_widget(kp_handler: CentralKeePassHandler):
     """Startet das DHL Label Tool als Widget mit bereits geöffnetem KeePass-Handler."""
     try:
@@ -54,72 +110,20 @@ def start_dhl_label_tool_widget(kp_handler: CentralKeePassHandler):
         
         with log_block("DHL API") as log:
             try:
-                # DHL API Zugangsdaten
-                dhl_api_username, dhl_api_password = kp_handler.get_credentials("DHL API Zugangsdaten", group="DHL Label Tool")
-                log("DHL API Zugangsdaten geladen")
-                if not all([dhl_api_username, dhl_api_password]):
-                    show_error_message("Fehler: DHL API Zugangsdaten (Username/Password) konnten nicht geladen werden.")
-                    return None
+                # Alle Zugangsdaten in einem Durchlauf laden
+                credentials, missing = load_dhl_credentials(kp_handler)
+                log("Zugangsdaten geladen")
             except Exception as e:
-                logger.error(f"Fehler beim Laden der DHL API Zugangsdaten: {str(e)}")
-                show_error_message(f"Fehler beim Laden der DHL API Zugangsdaten: {str(e)}")
+                logger.error(f"Fehler beim Laden der Zugangsdaten: {str(e)}")
+                show_error_message(f"Fehler beim Laden der Zugangsdaten: {str(e)}")
                 return None
 
-            try:
-                # DHL Client Credentials
-                client_id, client_secret = kp_handler.get_credentials("DHL Client Credentials", group="DHL Label Tool")
-                log("DHL Client Credentials geladen")
-                if not all([client_id, client_secret]):
-                    show_error_message("Fehler: DHL Client Credentials (ID/Secret) konnten nicht geladen werden.")
-                    return None
-            except Exception as e:
-                logger.error(f"Fehler beim Laden der DHL Client Credentials: {str(e)}")
-                show_error_message(f"Fehler beim Laden der DHL Client Credentials: {str(e)}")
-                return None
-
-            try:
-                # Zendesk API Token
-                zendesk_email, zendesk_token = kp_handler.get_credentials("Zendesk API Token", group="shared")
-                log("Zendesk API Zugangsdaten geladen")
-                if not all([zendesk_email, zendesk_token]):
-                    show_error_message("Fehler: Zendesk API Zugangsdaten (Email/Token) konnten nicht geladen werden.")
-                    return None
-            except Exception as e:
-                logger.error(f"Fehler beim Laden der Zendesk API Zugangsdaten: {str(e)}")
-                show_error_message(f"Fehler beim Laden der Zendesk API Zugangsdaten: {str(e)}")
-                return None
-
-            try:
-                # Billbee API Key
-                bb_api_key = kp_handler.get_credentials("BillBee API Key", group="shared")[1]
-                log("Billbee API Key geladen")
-                if not bb_api_key:
-                    show_error_message("Fehler: Billbee API Key konnte nicht geladen werden.")
-                    return None
-
-                # Billbee Basic Auth
-                bb_auth = kp_handler.get_credentials("BillBee Basic Auth", group="shared")
-                bb_api_user = bb_auth[0]
-                bb_api_password = bb_auth[1]
-                log("Billbee Basic Auth Daten geladen")
-                if not all([bb_api_user, bb_api_password]):
-                    show_error_message("Fehler: Billbee Basic Auth Daten konnten nicht geladen werden.")
-                    return None
-            except Exception as e:
-                logger.error(f"Fehler beim Laden der Billbee Zugangsdaten: {str(e)}")
-                show_error_message(f"Fehler beim Laden der Billbee Zugangsdaten: {str(e)}")
-                return None
-
-            try:
-                # DHL Billing
-                billing_number = kp_handler.get_credentials("DHL Billing", group="DHL Label Tool")[0]
-                log("DHL Billing Number geladen")
-                if not billing_number:
-                    show_error_message("Fehler: DHL Billing Number konnte nicht geladen werden.")
-                    return None
-            except Exception as e:
-                logger.error(f"Fehler beim Laden der DHL Billing Number: {str(e)}")
-                show_error_message(f"Fehler beim Laden der DHL Billing Number: {str(e)}")
+            # Fehlende Angaben gesammelt melden
+            if missing:
+                show_error_message(
+                    "Fehler: Folgende Zugangsdaten konnten nicht geladen werden:\n"
+                    + "\n".join(f"- {name}" for name in missing)
+                )
                 return None
 
         with log_block("DHL Label Tool Start") as log:
@@ -127,16 +131,8 @@ def start_dhl_label_tool_widget(kp_handler: CentralKeePassHandler):
             main_window.setWindowIcon(QIcon(":/icons/icon.ico"))
             
             # Setze die geladenen Credentials direkt
-            main_window.username = dhl_api_username
-            main_window.password = dhl_api_password
-            main_window.client_id = client_id
-            main_window.client_secret = client_secret
-            main_window.zendesk_email = zendesk_email
-            main_window.zendesk_token = zendesk_token
-            main_window.bb_api_key = bb_api_key
-            main_window.bb_api_user = bb_api_user
-            main_window.bb_api_password = bb_api_password
-            main_window.billing_number = billing_number
+            for attr, value in credentials.items():
+                setattr(main_window, attr, value)
             
             log("Hauptfenster wird angezeigt")
             main_window.show()
@@ -160,14 +156,14 @@ def main():
         
         app.setWindowIcon(QIcon(":/icons/icon.ico"))
         
-        # Lade Stylesheet
-        stylesheet_path = ":/global_style.qss"
-        qss_file = QFile(stylesheet_path)
-        if qss_file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
-            stylesheet = str(qss_file.readAll(), encoding="utf-8")
-            app.setStyleSheet(stylesheet)
+        # Lade Stylesheet (nur neu setzen, wenn es sich geändert hat - vermeidet erneutes QSS-Parsing)
+        try:
+            stylesheet = load_stylesheet()
+        except OSError as e:
+            logger.error(f"Das Stylesheet konnte nicht geladen werden: {e}")
         else:
-            logger.error("Das Stylesheet konnte nicht geladen werden.")
+            if app.styleSheet() != stylesheet:
+                app.setStyleSheet(stylesheet)
 
         # Versuche zentralen Handler aus dem CredentialCache zu holen
         credential_cache = get_credential_cache()
@@ -185,40 +181,11 @@ def main():
             main_window = DHLLabelGenerator()
             main_window.setWindowIcon(QIcon(":/icons/icon.ico"))
 
-            # Credentials laden
-            # DHL API Zugangsdaten
-            dhl_api_username, dhl_api_password = kp_handler.get_credentials("DHL API Zugangsdaten", group="DHL Label Tool")
-            log("DHL API Zugangsdaten geladen")
-            main_window.username = dhl_api_username
-            main_window.password = dhl_api_password
-
-            # DHL Client Credentials
-            client_id, client_secret = kp_handler.get_credentials("DHL Client Credentials", group="DHL Label Tool")
-            log("DHL Client Credentials geladen")
-            main_window.client_id = client_id
-            main_window.client_secret = client_secret
-
-            # Zendesk API Token
-            zendesk_email, zendesk_token = kp_handler.get_credentials("Zendesk API Token", group="shared")
-            log("Zendesk API Zugangsdaten geladen")
-            main_window.zendesk_email = zendesk_email
-            main_window.zendesk_token = zendesk_token
-
-            # Billbee API Key
-            bb_api_key = kp_handler.get_credentials("BillBee API Key", group="shared")[1]
-            # Billbee Basic Auth
-            bb_auth = kp_handler.get_credentials("BillBee Basic Auth", group="shared")
-            bb_api_user = bb_auth[0]
-            bb_api_password = bb_auth[1]
-            log("Billbee Zugangsdaten geladen")
-            main_window.bb_api_key = bb_api_key
-            main_window.bb_api_user = bb_api_user
-            main_window.bb_api_password = bb_api_password
-
-            # DHL Billing
-            billing_number = kp_handler.get_credentials("DHL Billing", group="DHL Label Tool")[0]
-            main_window.billing_number = billing_number
-            log("DHL Billing Number geladen")
+            # Credentials in einem Durchlauf laden
+            credentials, _ = load_dhl_credentials(kp_handler)
+            log("Zugangsdaten geladen")
+            for attr, value in credentials.items():
+                setattr(main_window, attr, value)
 
             log("Hauptfenster wird angezeigt")
             main_window.show()
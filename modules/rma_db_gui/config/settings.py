@@ -4,8 +4,9 @@ This module contains all configuration settings for the RMA Database GUI,
 including file paths, database settings, and GUI preferences.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Tuple
 from datetime import datetime
 
 from loguru import logger
@@ -14,8 +15,12 @@ import sys
 # Base paths
 MODULE_DIR: Path = Path(__file__).parent.parent
 
+@lru_cache(maxsize=1)
 def get_credentials_path() -> Path:
-    """Get the correct path to credentials.kdbx based on execution context."""
+    """Get the correct path to credentials.kdbx based on execution context.
+
+    The result is cached; the path does not change during a process lifetime.
+    """
     if getattr(sys, "frozen", False):
         # When running as executable, PyInstaller puts it in _internal
         base_path = Path(sys.executable).parent
@@ -29,9 +34,6 @@ def get_credentials_path() -> Path:
         # Development mode
         return MODULE_DIR.parent.parent / "credentials.kdbx"
 
-# Verwende die credentials.kdbx aus dem korrekten Verzeichnis
-CREDENTIALS_FILE: Path = get_credentials_path()
-
 # Logging settings
 LOG_DIR: Path = MODULE_DIR / "logs"
 LOG_LEVEL: str = "INFO"
@@ -82,6 +84,12 @@ def setup_logging(level: str = LOG_LEVEL) -> None:
     
     logger.info(f"Logging initialisiert mit Level: {level}")
 
+def __getattr__(name: str):
+    """Resolve CREDENTIALS_FILE lazily instead of touching the filesystem on import."""
+    if name == "CREDENTIALS_FILE":
+        return get_credentials_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Database settings
 DB_NAME: str = "rma"
 DB_HOST: str = "localhost"
@@ -104,6 +112,19 @@ TABLE_ALTERNATING_COLORS: bool = True
 TABLE_SELECTION_BEHAVIOR: str = "SelectRows"
 TABLE_EDIT_TRIGGERS: str = "NoEditTriggers"
 
+# RMA types: database value -> German display name
+TYPE_DISPLAY_NAMES: Dict[str, str] = {
+    "repair": "Reparatur",
+    "return": "Widerruf",
+    "replace": "Ersatz",
+    "refund": "Rückerstattung",
+    "other": "Sonstiges",
+}
+# German display name -> database value
+TYPE_DB_VALUES: Dict[str, str] = {
+    display: value for value, display in TYPE_DISPLAY_NAMES.items()
+}
+
 # Status bar settings
 STATUS_BAR_FONT_SIZE: int = 9
 STATUS_MESSAGE_TIMEOUT: int = 5000  # milliseconds 
\ No newline at end of file
@@ -6,18 +6,18 @@ an SSH tunnel, using credentials stored in a KeePass database.
 
 from __future__ import annotations
 
+import atexit
 import io
 import os
 import re
-import tempfile
+import threading
 from contextlib import contextmanager
-from pathlib import Path
-from typing import Any, Dict, Generator, Optional, Tuple
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 import paramiko
 import pymysql
 from loguru import logger
-from pymysql.cursors import DictCursor
+from pymysql.cursors import Cursor, DictCursor
 from pymysql.connections import Connection as MySQLConnection
 from sshtunnel import SSHTunnelForwarder
 
@@ -25,6 +25,27 @@ from ..config.settings import DB_NAME
 from ..utils.keepass_handler import KeepassHandler
 
 
+SSH_KEEPALIVE_SECONDS: float = 30.0
+
+# Prozessweit geteilter Tunnel, damit neue Fenster/Instanzen keinen
+# weiteren SSH-Handshake brauchen
+_shared_tunnel: Optional[SSHTunnelForwarder] = None
+_shared_tunnel_lock = threading.Lock()
+
+
+def _stop_shared_tunnel() -> None:
+    """Stop the process-wide SSH tunnel if one is running."""
+    global _shared_tunnel
+    with _shared_tunnel_lock:
+        tunnel, _shared_tunnel = _shared_tunnel, None
+    if tunnel:
+        tunnel.stop()
+        logger.debug("SSH tunnel stopped")
+
+
+atexit.register(_stop_shared_tunnel)
+
+
 class DatabaseConnectionError(Exception):
     """Base exception for database connection errors."""
 
@@ -47,14 +68,19 @@ class DatabaseConnection:
     """Handler for database connections with SSH tunnel support.
 
     This class manages secure database connections through an SSH tunnel,
-    using credentials stored in a KeePass database. It handles the lifecycle
-    of both the SSH tunnel and the database connection.
+    using credentials stored in a KeePass database. The tunnel is shared by
+    all instances in the process and kept open between queries, and released
+    MySQL connections are kept in a small idle pool, so repeated queries do
+    not pay the SSH and MySQL handshakes again.
 
     Attributes:
         keepass_handler (KeepassHandler): Handler for KeePass credentials.
         _tunnel (Optional[SSHTunnelForwarder]): Active SSH tunnel instance.
+        _idle_connections (List[MySQLConnection]): Reusable open connections.
     """
 
+    MAX_IDLE_CONNECTIONS: int = 5
+
     def __init__(self, keepass_handler: KeepassHandler) -> None:
         """Initialize the database connection handler.
 
@@ -69,19 +95,20 @@ class DatabaseConnection:
 
         self.keepass_handler: KeepassHandler = keepass_handler
         self._tunnel: Optional[SSHTunnelForwarder] = None
+        self._idle_connections: List[MySQLConnection] = []
+        self._lock = threading.Lock()
 
     def _setup_ssh_tunnel(self) -> None:
         """Set up SSH tunnel to the database server.
 
         This method establishes an SSH tunnel using credentials from KeePass.
-        It handles the private key securely by storing it temporarily and
-        loading it using paramiko.
+        The private key is loaded by paramiko directly from memory and is
+        never written to disk.
 
         Raises:
             SSHConnectionError: If SSH connection fails.
             KeyError: If required credentials are missing.
         """
-        tmp_key_path: Optional[str] = None
         try:
             # Polymorphie: CentralKeePassHandler oder KeepassHandler
             if hasattr(self.keepass_handler, 'get_ssh_credentials'):
@@ -105,16 +132,10 @@ class DatabaseConnection:
                 ssh_creds["username"]
             )
             
-            # Store private key temporarily
-            with tempfile.NamedTemporaryFile(delete=False, mode="wb") as tmp_key:
-                tmp_key.write(ssh_creds["private_key"].encode("utf-8"))
-                tmp_key_path = tmp_key.name
-            logger.debug("Private key stored temporarily")
-
             # Load key using paramiko
             try:
-                key: paramiko.RSAKey = paramiko.RSAKey.from_private_key_file(
-                    tmp_key_path,
+                key: paramiko.RSAKey = paramiko.RSAKey.from_private_key(
+                    io.StringIO(ssh_creds["private_key"]),
                     password=ssh_creds["password"]
                 )
                 logger.debug("Private key loaded successfully")
@@ -132,7 +153,8 @@ class DatabaseConnection:
                 ssh_password=ssh_creds["password"],
                 ssh_pkey=key,
                 remote_bind_address=("127.0.0.1", 3306),
-                local_bind_address=("127.0.0.1", 0)
+                local_bind_address=("127.0.0.1", 0),
+                set_keepalive=SSH_KEEPALIVE_SECONDS,
             )
             
             logger.debug("Starting SSH tunnel...")
@@ -142,15 +164,6 @@ class DatabaseConnection:
         except Exception as e:
             logger.error("SSH tunnel error: {}", str(e))
             raise SSHConnectionError(f"Failed to establish SSH tunnel: {e}") from e
-            
-        finally:
-            # Clean up temporary key file
-            if tmp_key_path and Path(tmp_key_path).exists():
-                try:
-                    Path(tmp_key_path).unlink()
-                    logger.debug("Temporary key file removed")
-                except OSError as e:
-                    logger.warning("Failed to remove temporary key file: {}", e)
 
     def _get_mysql_connection(self) -> MySQLConnection:
         """Create MySQL connection through SSH tunnel.
@@ -191,12 +204,84 @@ class DatabaseConnection:
             logger.error(f"Fehlende MySQL-Anmeldedaten: {e}")
             raise MySQLConnectionError(f"Missing required MySQL credentials: {e}") from e
 
+    def _ensure_tunnel(self) -> None:
+        """Attach to the shared SSH tunnel, opening it if it is not active.
+
+        Idle connections belong to the previous tunnel and are discarded
+        whenever the tunnel changes.
+        """
+        global _shared_tunnel
+        with self._lock:
+            if self._tunnel and self._tunnel.is_active:
+                return
+            stale = self._idle_connections
+            self._idle_connections = []
+            with _shared_tunnel_lock:
+                if _shared_tunnel and _shared_tunnel.is_active:
+                    self._tunnel = _shared_tunnel
+                else:
+                    if _shared_tunnel:
+                        _shared_tunnel.stop()
+                    _shared_tunnel = None
+                    self._tunnel = None
+                    self._setup_ssh_tunnel()
+                    _shared_tunnel = self._tunnel
+        for connection in stale:
+            self._close_quietly(connection)
+
+    def _acquire_connection(self) -> MySQLConnection:
+        """Take a live connection from the idle pool or open a new one.
+
+        Returns:
+            MySQLConnection: MySQL connection object.
+        """
+        while True:
+            with self._lock:
+                if not self._idle_connections:
+                    break
+                connection = self._idle_connections.pop()
+            try:
+                connection.ping(reconnect=False)
+                return connection
+            except pymysql.MySQLError:
+                logger.debug("Discarding stale pooled MySQL connection")
+                self._close_quietly(connection)
+        return self._get_mysql_connection()
+
+    def _release_connection(self, connection: MySQLConnection, reusable: bool) -> None:
+        """Return a connection to the idle pool or close it.
+
+        Args:
+            connection: Connection to release.
+            reusable: False if the caller failed while using the connection.
+        """
+        if reusable and connection.open:
+            try:
+                # Offene Transaktion (auch implizite Snapshots von SELECTs) beenden
+                connection.rollback()
+            except pymysql.MySQLError:
+                reusable = False
+            if reusable:
+                with self._lock:
+                    if len(self._idle_connections) < self.MAX_IDLE_CONNECTIONS:
+                        self._idle_connections.append(connection)
+                        return
+        self._close_quietly(connection)
+
+    @staticmethod
+    def _close_quietly(connection: MySQLConnection) -> None:
+        """Close a connection, ignoring errors from already broken sockets."""
+        try:
+            connection.close()
+        except Exception:
+            pass
+
     @contextmanager
     def get_connection(self) -> Generator[MySQLConnection, None, None]:
         """Get database connection through SSH tunnel.
 
-        This context manager handles the lifecycle of both the SSH tunnel
-        and the database connection, ensuring proper cleanup.
+        The shared SSH tunnel stays open after the block ends and the
+        connection is returned to the idle pool. Call close() to release both.
 
         Yields:
             MySQLConnection: MySQL connection object.
@@ -205,40 +290,54 @@ class DatabaseConnection:
             DatabaseConnectionError: If connection fails.
         """
         try:
-            if not self._tunnel or not self._tunnel.is_active:
-                self._setup_ssh_tunnel()
+            self._ensure_tunnel()
 
-            connection: MySQLConnection = self._get_mysql_connection()
+            connection: MySQLConnection = self._acquire_connection()
+            reusable = True
             try:
                 yield connection
+            except BaseException:
+                reusable = False
+                raise
             finally:
-                connection.close()
+                self._release_connection(connection, reusable)
         except Exception as e:
             logger.error("Database connection failed: {}", str(e))
             raise DatabaseConnectionError(f"Database connection failed: {e}") from e
-        finally:
-            if self._tunnel:
-                self._tunnel.stop()
-                self._tunnel = None
+
+    def close(self) -> None:
+        """Close all pooled connections and stop the shared SSH tunnel."""
+        with self._lock:
+            idle = self._idle_connections
+            self._idle_connections = []
+            self._tunnel = None
+        for connection in idle:
+            self._close_quietly(connection)
+        _stop_shared_tunnel()
 
     def execute_query(
-        self, query: str, params: Optional[Dict[str, Any]] = None
-    ) -> list[Dict[str, Any]]:
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        as_tuples: bool = False,
+    ) -> list[Any]:
         """Execute a database query.
 
         Args:
             query: SQL query to execute.
             params: Optional parameters for the query.
+            as_tuples: Return plain row tuples instead of dictionaries. This
+                skips building a dict per row for simple lookups.
 
         Returns:
-            List of dictionaries containing query results.
+            List of dictionaries (or tuples) containing query results.
 
         Raises:
             DatabaseConnectionError: If query execution fails.
         """
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
+                with conn.cursor(Cursor if as_tuples else None) as cursor:
                     cursor.execute(query, params or {})
                     return cursor.fetchall()
         except Exception as e:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from PySide6.QtCore import Qt
@@ -24,6 +25,9 @@ from PySide6.QtWidgets import (
 )
 
 from loguru import logger
+from pymysql.cursors import Cursor
+
+from ..config.settings import TYPE_DB_VALUES, TYPE_DISPLAY_NAMES
 from ..database.connection import DatabaseConnection
 
 
@@ -59,10 +63,7 @@ class EntryDialog(QDialog):
         self.setMinimumHeight(600)
         
         self._setup_ui()
-        self._load_dropdown_data()
-        
-        if is_edit_mode and ticket_number:
-            self._load_existing_data()
+        self._load_data()
 
     def _setup_ui(self) -> None:
         """Richtet die Benutzeroberfläche ein."""
@@ -87,7 +88,7 @@ class EntryDialog(QDialog):
         
         # Type
         self.type_input = QComboBox()
-        self.type_input.addItems(["Reparatur", "Widerruf", "Ersatz", "Rückerstattung", "Sonstiges"])
+        self.type_input.addItems(list(TYPE_DB_VALUES))
         self.type_input.setEditable(True)
         form_layout.addRow("Typ:", self.type_input)
         
@@ -168,23 +169,52 @@ class EntryDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
-    def _load_dropdown_data(self) -> None:
-        """Lädt die Daten für die Dropdown-Menüs."""
+    def _load_data(self) -> None:
+        """Lädt Dropdown-Daten und (im Bearbeitungsmodus) den Eintrag.
+
+        Beide Abfragen sind unabhängig und laufen parallel über eigene
+        Pool-Verbindungen; die Widgets werden danach im GUI-Thread befüllt.
+        """
         if not self.db_connection:
             return
-            
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            dropdown_future = pool.submit(self._fetch_dropdown_data)
+            entry_future = None
+            if self.is_edit_mode and self.ticket_number:
+                entry_future = pool.submit(self._fetch_existing_data)
+
+            # Dropdowns zuerst füllen, damit findData() den Eintrag findet
+            self._load_dropdown_data(dropdown_future)
+            if entry_future is not None:
+                self._load_existing_data(entry_future)
+
+    def _fetch_dropdown_data(self) -> Tuple[List[Tuple[str, str]], List[Tuple[int, str]]]:
+        """Fragt Handlers und Storage Locations ab.
+
+        Returns:
+            Tuple: (Handler als (Initialen, Anzeigename), Lagerorte als (ID, Name))
+        """
+        # Handlers und Storage Locations über eine Verbindung laden
+        # (als Tupel, ohne Dict pro Zeile)
+        with self.db_connection.get_connection() as conn:
+            with conn.cursor(Cursor) as cursor:
+                cursor.execute("SELECT Initials, Name FROM Handlers ORDER BY Name")
+                handlers = [(initials, f"{name} ({initials})")
+                            for initials, name in cursor.fetchall()]
+
+                cursor.execute("SELECT ID, LocationName FROM StorageLocations ORDER BY LocationName")
+                storage_locations = list(cursor.fetchall())
+        return handlers, storage_locations
+
+    def _load_dropdown_data(self, dropdown_future: Future) -> None:
+        """Befüllt die Dropdown-Menüs.
+
+        Args:
+            dropdown_future: Laufende Abfrage aus _fetch_dropdown_data
+        """
         try:
-            # Lade Handlers
-            handlers_query = "SELECT Initials, Name FROM Handlers ORDER BY Name"
-            handlers_result = self.db_connection.execute_query(handlers_query)
-            self.handlers = [(row['Initials'], f"{row['Name']} ({row['Initials']})") 
-                           for row in handlers_result] if handlers_result else []
-            
-            # Lade Storage Locations
-            locations_query = "SELECT ID, LocationName FROM StorageLocations ORDER BY LocationName"
-            locations_result = self.db_connection.execute_query(locations_query)
-            self.storage_locations = [(row['ID'], row['LocationName']) 
-                                    for row in locations_result] if locations_result else []
+            self.handlers, self.storage_locations = dropdown_future.result()
             
             # Fülle Dropdowns
             self.last_handler_input.clear()
@@ -202,104 +232,92 @@ class EntryDialog(QDialog):
 
     def _convert_type_to_db(self, display_text: str) -> str:
         """Konvertiert deutschen Type-Text zu englischem Datenbankwert."""
-        type_mapping = {
-            'Reparatur': 'repair',
-            'Widerruf': 'return',
-            'Ersatz': 'replace',
-            'Rückerstattung': 'refund',
-            'Sonstiges': 'other'
-        }
-        return type_mapping.get(display_text, display_text)
+        return TYPE_DB_VALUES.get(display_text, display_text)
 
-    def _load_existing_data(self) -> None:
-        """Lädt existierende Daten für den Bearbeitungsmodus."""
-        if not self.db_connection or not self.ticket_number:
-            return
-            
+    def _fetch_existing_data(self) -> list[Any]:
+        """Fragt Fall, Produkt und Reparatur-Details in einer Abfrage ab."""
+        entry_query = """
+            SELECT
+                c.TicketNumber, c.OrderNumber, c.Type, c.EntryDate,
+                c.Status, c.ExitDate, c.TrackingNumber, c.IsAmazon,
+                c.StorageLocationID,
+                p.TicketNumber IS NOT NULL AS HasProduct,
+                p.ProductName, p.SerialNumber, p.Quantity,
+                rd.TicketNumber IS NOT NULL AS HasRepairDetails,
+                rd.CustomerDescription, rd.ProblemCause,
+                rd.LastAction, rd.LastHandler
+            FROM RMA_Cases c
+            LEFT JOIN RMA_Products p
+                ON p.TicketNumber = c.TicketNumber AND p.IsDeleted = FALSE
+            LEFT JOIN RMA_RepairDetails rd
+                ON rd.TicketNumber = c.TicketNumber AND rd.IsDeleted = FALSE
+            WHERE c.TicketNumber = %s
+            LIMIT 1
+        """
+        return self.db_connection.execute_query(entry_query, (self.ticket_number,))
+
+    def _load_existing_data(self, entry_future: Future) -> None:
+        """Befüllt das Formular mit existierenden Daten (Bearbeitungsmodus).
+
+        Args:
+            entry_future: Laufende Abfrage aus _fetch_existing_data
+        """
         try:
-            # Lade RMA_Cases Daten
-            cases_query = """
-                SELECT c.*, s.LocationName
-                FROM RMA_Cases c
-                LEFT JOIN StorageLocations s ON c.StorageLocationID = s.ID
-                WHERE c.TicketNumber = %s
-            """
-            cases_result = self.db_connection.execute_query(cases_query, (self.ticket_number,))
+            entry_result = entry_future.result()
+            if not entry_result:
+                return
+
+            case_data = entry_result[0]
             
-            if cases_result:
-                case_data = cases_result[0]
-                
-                # Fülle Formular mit existierenden Daten
-                self.ticket_number_input.setText(case_data.get('TicketNumber', ''))
-                self.order_number_input.setText(case_data.get('OrderNumber', ''))
-                
-                # Type
-                type_text = case_data.get('Type', '')
-                # Type-Mapping: Englische Werte -> Deutsche Anzeige
-                type_mapping = {
-                    'repair': 'Reparatur',
-                    'return': 'Widerruf',
-                    'replace': 'Ersatz',
-                    'refund': 'Rückerstattung',
-                    'other': 'Sonstiges'
-                }
-                display_text = type_mapping.get(type_text, type_text)
-                index = self.type_input.findText(display_text)
-                if index >= 0:
-                    self.type_input.setCurrentIndex(index)
-                else:
-                    self.type_input.setCurrentText(display_text)
-                
-                # Dates
-                if case_data.get('EntryDate'):
-                    self.entry_date_input.setDate(case_data['EntryDate'])
-                if case_data.get('ExitDate'):
-                    self.exit_date_input.setDate(case_data['ExitDate'])
-                
-                # Status
-                status_text = case_data.get('Status', '')
-                index = self.status_input.findText(status_text)
-                if index >= 0:
-                    self.status_input.setCurrentIndex(index)
-                
-                self.tracking_number_input.setText(case_data.get('TrackingNumber', ''))
-                self.is_amazon_input.setChecked(case_data.get('IsAmazon', False))
-                
-                # Storage Location
-                storage_id = case_data.get('StorageLocationID')
-                if storage_id:
-                    index = self.storage_location_input.findData(storage_id)
-                    if index >= 0:
-                        self.storage_location_input.setCurrentIndex(index)
+            # Fülle Formular mit existierenden Daten
+            self.ticket_number_input.setText(case_data.get('TicketNumber', ''))
+            self.order_number_input.setText(case_data.get('OrderNumber', ''))
+            
+            # Type
+            type_text = case_data.get('Type', '')
+            display_text = TYPE_DISPLAY_NAMES.get(type_text, type_text)
+            index = self.type_input.findText(display_text)
+            if index >= 0:
+                self.type_input.setCurrentIndex(index)
+            else:
+                self.type_input.setCurrentText(display_text)
             
-            # Lade RMA_Products Daten
-            products_query = """
-                SELECT * FROM RMA_Products 
-                WHERE TicketNumber = %s AND IsDeleted = FALSE
-            """
-            products_result = self.db_connection.execute_query(products_query, (self.ticket_number,))
+            # Dates
+            if case_data.get('EntryDate'):
+                self.entry_date_input.setDate(case_data['EntryDate'])
+            if case_data.get('ExitDate'):
+                self.exit_date_input.setDate(case_data['ExitDate'])
             
-            if products_result:
-                product_data = products_result[0]
-                self.product_name_input.setText(product_data.get('ProductName', ''))
-                self.serial_number_input.setText(product_data.get('SerialNumber', ''))
-                self.quantity_input.setValue(product_data.get('Quantity', 1))
+            # Status
+            status_text = case_data.get('Status', '')
+            index = self.status_input.findText(status_text)
+            if index >= 0:
+                self.status_input.setCurrentIndex(index)
+            
+            self.tracking_number_input.setText(case_data.get('TrackingNumber', ''))
+            self.is_amazon_input.setChecked(case_data.get('IsAmazon', False))
+            
+            # Storage Location
+            storage_id = case_data.get('StorageLocationID')
+            if storage_id:
+                index = self.storage_location_input.findData(storage_id)
+                if index >= 0:
+                    self.storage_location_input.setCurrentIndex(index)
             
-            # Lade RMA_RepairDetails Daten
-            repair_query = """
-                SELECT * FROM RMA_RepairDetails 
-                WHERE TicketNumber = %s AND IsDeleted = FALSE
-            """
-            repair_result = self.db_connection.execute_query(repair_query, (self.ticket_number,))
+            # RMA_Products Daten
+            if case_data.get('HasProduct'):
+                self.product_name_input.setText(case_data.get('ProductName', ''))
+                self.serial_number_input.setText(case_data.get('SerialNumber', ''))
+                self.quantity_input.setValue(case_data.get('Quantity', 1))
             
-            if repair_result:
-                repair_data = repair_result[0]
-                self.customer_description_input.setText(repair_data.get('CustomerDescription', ''))
-                self.problem_cause_input.setText(repair_data.get('ProblemCause', ''))
-                self.last_action_input.setText(repair_data.get('LastAction', ''))
+            # RMA_RepairDetails Daten
+            if case_data.get('HasRepairDetails'):
+                self.customer_description_input.setText(case_data.get('CustomerDescription', ''))
+                self.problem_cause_input.setText(case_data.get('ProblemCause', ''))
+                self.last_action_input.setText(case_data.get('LastAction', ''))
                 
                 # Last Handler
-                last_handler = repair_data.get('LastHandler')
+                last_handler = case_data.get('LastHandler')
                 if last_handler:
                     index = self.last_handler_input.findData(last_handler)
                     if index >= 0:
@@ -334,13 +352,39 @@ class EntryDialog(QDialog):
         # Bestellnummer ist nicht mehr Pflicht
         return True
 
+    def _collect_form_values(self) -> Dict[str, Any]:
+        """Liest alle Formularfelder einmal aus und bereinigt sie.
+
+        Returns:
+            Dict[str, Any]: Feldwerte für die INSERT-/UPDATE-Statements
+        """
+        return {
+            'ticket_number': self.ticket_number_input.text().strip(),
+            'order_number': self.order_number_input.text().strip(),
+            'type': self._convert_type_to_db(self.type_input.currentText()),
+            'entry_date': self.entry_date_input.date().toPython(),
+            'status': self.status_input.currentText(),
+            'exit_date': self.exit_date_input.date().toPython(),
+            'tracking_number': self.tracking_number_input.text().strip(),
+            'is_amazon': self.is_amazon_input.isChecked(),
+            'storage_location_id': self.storage_location_input.currentData() or None,
+            'product_name': self.product_name_input.text().strip(),
+            'serial_number': self.serial_number_input.text().strip(),
+            'quantity': self.quantity_input.value(),
+            'customer_description': self.customer_description_input.toPlainText().strip(),
+            'problem_cause': self.problem_cause_input.toPlainText().strip(),
+            'last_action': self.last_action_input.toPlainText().strip(),
+            'last_handler': self.last_handler_input.currentData() or None,
+        }
+
     def _create_new_entry(self) -> None:
         """Erstellt einen neuen RMA-Eintrag."""
         if not self.db_connection:
             raise Exception("Keine Datenbankverbindung")
             
-        ticket_number = self.ticket_number_input.text().strip()
-        order_number = self.order_number_input.text().strip()
+        values = self._collect_form_values()
+        ticket_number = values['ticket_number']
+        order_number = values['order_number']
         
         with self.db_connection.get_connection() as conn:
             cursor = conn.cursor()
@@ -358,13 +402,13 @@ class EntryDialog(QDialog):
                 """, (
                     ticket_number,
                     order_number,
-                    self._convert_type_to_db(self.type_input.currentText()),
-                    self.entry_date_input.date().toPython(),
-                    self.status_input.currentText(),
-                    self.exit_date_input.date().toPython(),
-                    self.tracking_number_input.text().strip(),
-                    self.is_amazon_input.isChecked(),
-                    self.storage_location_input.currentData() or None
+                    values['type'],
+                    values['entry_date'],
+                    values['status'],
+                    values['exit_date'],
+                    values['tracking_number'],
+                    values['is_amazon'],
+                    values['storage_location_id']
                 ))
                 
                 # Erstelle RMA_Products Eintrag
@@ -375,9 +419,9 @@ class EntryDialog(QDialog):
                 """, (
                     ticket_number,
                     order_number,
-                    self.product_name_input.text().strip(),
-                    self.serial_number_input.text().strip(),
-                    self.quantity_input.value()
+                    values['product_name'],
+                    values['serial_number'],
+                    values['quantity']
                 ))
                 
                 # Erstelle RMA_RepairDetails Eintrag
@@ -389,10 +433,10 @@ class EntryDialog(QDialog):
                 """, (
                     ticket_number,
                     order_number,
-                    self.customer_description_input.toPlainText().strip(),
-                    self.problem_cause_input.toPlainText().strip(),
-                    self.last_action_input.toPlainText().strip(),
-                    self.last_handler_input.currentData() or None
+                    values['customer_description'],
+                    values['problem_cause'],
+                    values['last_action'],
+                    values['last_handler']
                 ))
                 
                 # Commit Transaktion
@@ -408,6 +452,8 @@ class EntryDialog(QDialog):
         if not self.db_connection or not self.ticket_number:
             raise Exception("Keine Datenbankverbindung oder Ticket-Nummer")
             
+        values = self._collect_form_values()
+        
         with self.db_connection.get_connection() as conn:
             cursor = conn.cursor()
             
@@ -423,14 +469,14 @@ class EntryDialog(QDialog):
                         StorageLocationID = %s
                     WHERE TicketNumber = %s
                 """, (
-                    self.order_number_input.text().strip(),
-                    self._convert_type_to_db(self.type_input.currentText()),
-                    self.entry_date_input.date().toPython(),
-                    self.status_input.currentText(),
-                    self.exit_date_input.date().toPython(),
-                    self.tracking_number_input.text().strip(),
-                    self.is_amazon_input.isChecked(),
-                    self.storage_location_input.currentData() or None,
+                    values['order_number'],
+                    values['type'],
+                    values['entry_date'],
+                    values['status'],
+                    values['exit_date'],
+                    values['tracking_number'],
+                    values['is_amazon'],
+                    values['storage_location_id'],
                     self.ticket_number
                 ))
                 
@@ -441,10 +487,10 @@ class EntryDialog(QDialog):
                         Quantity = %s
                     WHERE TicketNumber = %s AND IsDeleted = FALSE
                 """, (
-                    self.order_number_input.text().strip(),
-                    self.product_name_input.text().strip(),
-                    self.serial_number_input.text().strip(),
-                    self.quantity_input.value(),
+                    values['order_number'],
+                    values['product_name'],
+                    values['serial_number'],
+                    values['quantity'],
                     self.ticket_number
                 ))
                 
@@ -455,11 +501,11 @@ class EntryDialog(QDialog):
                         ProblemCause = %s, LastAction = %s, LastHandler = %s
                     WHERE TicketNumber = %s AND IsDeleted = FALSE
                 """, (
-                    self.order_number_input.text().strip(),
-                    self.customer_description_input.toPlainText().strip(),
-                    self.problem_cause_input.toPlainText().strip(),
-                    self.last_action_input.toPlainText().strip(),
-                    self.last_handler_input.currentData() or None,
+                    values['order_number'],
+                    values['customer_description'],
+                    values['problem_cause'],
+                    values['last_action'],
+                    values['last_handler'],
                     self.ticket_number
                 ))
                 
@@ -6,10 +6,11 @@ interface for managing RMA database entries.
 
 from __future__ import annotations
 
+import re
 import sys
 import threading
-from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Set, Tuple
+from datetime import date
 
 from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtGui import QIcon, QFont, QAction, QKeyEvent, QColor
@@ -40,6 +41,7 @@ from PySide6.QtWidgets import (
 from shared.utils.enhanced_logging import LoggingMessageBox, log_error_and_show_dialog
 from shared.utils.unified_logger import get_logger
 
+from ..config.settings import TYPE_DB_VALUES, TYPE_DISPLAY_NAMES
 from ..database.connection import DatabaseConnection, DatabaseConnectionError
 from ..utils.keepass_handler import KeepassHandler, KeepassError
 from .dialogs import DeleteConfirmationDialog
@@ -56,6 +58,22 @@ logger = get_logger("RMA-Database-GUI")
 # Lokale Konstanten
 WINDOW_TITLE = "RMA Database GUI"
 WINDOW_SIZE = (800, 600)
+# Initialen aus der Anzeige "Name (Initialen)"
+HANDLER_INITIALS_PATTERN = re.compile(r'\(([^)]+)\)$')
+
+# Google Sheets Farbkodierung je Status:
+# 🟡 Gelb = Offene Fälle
+# 🟢 Grün = Erledigte Fälle
+# 🔵 Blau = Auf Kundenrückmeldung warten
+# ⚪ Weiß = Standard
+STATUS_COLORS: Dict[str, QColor] = {
+    'Open': QColor(255, 255, 153),  # Google Sheets Gelb
+    'Waiting for Customer Feedback': QColor(173, 216, 230),  # Google Sheets Blau
+    'Completed': QColor(144, 238, 144),  # Google Sheets Grün
+    'In Progress': QColor(200, 220, 255),  # Helles Blau
+    'Shipping': QColor(100, 150, 255),  # Dunkles Blau (DHL-Label erstellt, unterwegs)
+}
+DEFAULT_STATUS_COLOR = QColor(255, 255, 255)  # Weiß für unbekannte Status
 
 
 class MainWindow(QMainWindow):
@@ -98,6 +116,13 @@ class MainWindow(QMainWindow):
         self._pending_updates: Dict[Tuple[str, str], Dict[str, Any]] = {}
         self._suppress_table_change: bool = False
         self._row_by_ticket: Dict[str, int] = {}
+        # Zuletzt bekannte Server-Daten je TicketNumber (aus original_data)
+        self._original_by_ticket: Dict[str, Dict[str, Any]] = {}
+
+        # Lagerorte (Name -> ID) und Bearbeiter (Name -> Initialen),
+        # werden bei jedem Reload neu geladen
+        self._storage_locations: Optional[Dict[str, int]] = None
+        self._handlers: Optional[Dict[str, str]] = None
 
         self._setup_ui()
         self._setup_toolbar()
@@ -105,6 +130,10 @@ class MainWindow(QMainWindow):
         self._setup_connections()
         try:
             self.db_connection = DatabaseConnection(self.central_kp_handler)
+            # Tunnel und Verbindungs-Pool erst beim Beenden der Anwendung schließen
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.db_connection.close)
             self.load_rma_data()
         except Exception as e:
             self._show_error("Verbindungsfehler", str(e))
@@ -460,16 +489,20 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            logger.info("Starte load_rma_data - Lade Daten aus der Datenbank")
+            logger.debug("Starte load_rma_data - Lade Daten aus der Datenbank")
             
             # Speichere aktuelle Sortierreihenfolge
             header = self.table.horizontalHeader()
             current_sort_column = header.sortIndicatorSection()
             current_sort_order = header.sortIndicatorOrder()
-            logger.info(f"Aktuelle Sortierung - Spalte: {current_sort_column}, Richtung: {current_sort_order}")
+            logger.debug("Aktuelle Sortierung - Spalte: {}, Richtung: {}", current_sort_column, current_sort_order)
             
             # Qt übernimmt die Sortierung automatisch
 
+            # Lagerorte und Bearbeiter beim nächsten Zugriff frisch laden
+            self._storage_locations = None
+            self._handlers = None
+
             # Execute query to get RMA data with storage location names and handler
             if self.show_deleted_entries:
                 # Papierkorb-Ansicht: Zeige gelöschte Einträge
@@ -521,12 +554,15 @@ class MainWindow(QMainWindow):
                     WHERE c.IsDeleted = FALSE
                     ORDER BY c.TicketNumber DESC
                 """
-            logger.info("Führe Datenbankabfrage aus")
+            logger.debug("Führe Datenbankabfrage aus")
             results = self.db_connection.execute_query(query)
-            logger.info(f"Datenbankabfrage abgeschlossen - {len(results) if results else 0} Ergebnisse erhalten")
+            logger.debug("Datenbankabfrage abgeschlossen - {} Ergebnisse erhalten", len(results) if results else 0)
 
             # Speichere ursprüngliche Daten für Suche
             self.original_data = results.copy() if results else []
+            self._original_by_ticket = {
+                row_data.get('TicketNumber'): row_data for row_data in self.original_data
+            }
 
             if not results:
                 logger.info("Keine RMA-Daten gefunden - Tabelle wird geleert")
@@ -550,7 +586,7 @@ class MainWindow(QMainWindow):
                     'Status', 'ExitDate', 'TrackingNumber', 'IsAmazon',
                     'StorageLocation', 'LastHandler'
                 ]
-            logger.info(f"Richte Tabelle ein - {len(results)} Zeilen, {len(visible_columns)} Spalten")
+            logger.debug("Richte Tabelle ein - {} Zeilen, {} Spalten", len(results), len(visible_columns))
             self.table.setRowCount(len(results))
             self.table.setColumnCount(len(visible_columns))
             
@@ -566,13 +602,13 @@ class MainWindow(QMainWindow):
                 else:
                     headers.append(col)
             self.table.setHorizontalHeaderLabels(headers)
-            logger.info(f"Spaltenüberschriften gesetzt: {headers}")
+            logger.debug("Spaltenüberschriften gesetzt: {}", headers)
 
             # Blockiere Signale während des Füllens der Tabelle
             self.table.blockSignals(True)
             
             # Fill table with data
-            logger.info("Fülle Tabelle mit Daten")
+            logger.debug("Fülle Tabelle mit Daten")
             for row_idx, row_data in enumerate(results):
                 col_idx = 0
                 for key in visible_columns:
@@ -583,16 +619,8 @@ class MainWindow(QMainWindow):
                         display_value = f"{handler_name} ({initials})" if handler_name else initials
                         item = QTableWidgetItem(display_value)
                     elif key == 'Type':
-                        # Type-Mapping: Englische Werte -> Deutsche Anzeige
-                        type_mapping = {
-                            'repair': 'Reparatur',
-                            'return': 'Widerruf',
-                            'replace': 'Ersatz',
-                            'refund': 'Rückerstattung',
-                            'other': 'Sonstiges'
-                        }
                         value = row_data.get(key)
-                        display_value = type_mapping.get(value, value) if value else ''
+                        display_value = TYPE_DISPLAY_NAMES.get(value, value) if value else ''
                         item = QTableWidgetItem(display_value)
                     else:
                         value = row_data.get(key)
@@ -601,9 +629,10 @@ class MainWindow(QMainWindow):
                     # Setze die Sortierreihenfolge für verschiedene Datentypen
                     if key in ['EntryDate', 'ExitDate']:
                         try:
-                            date = datetime.strptime(str(value), '%Y-%m-%d').date()
+                            # PyMySQL liefert DATE-Spalten bereits als date
+                            date_value = value if isinstance(value, date) else date.fromisoformat(str(value))
                             item.setData(Qt.ItemDataRole.DisplayRole, str(value))
-                            item.setData(Qt.ItemDataRole.UserRole, date)
+                            item.setData(Qt.ItemDataRole.UserRole, date_value)
                         except (ValueError, TypeError):
                             item.setData(Qt.ItemDataRole.DisplayRole, '')
                     elif key == 'TicketNumber':
@@ -651,7 +680,7 @@ class MainWindow(QMainWindow):
             # Bedingte Formatierung anwenden
             self._apply_conditional_formatting()
             
-            logger.info("Tabelle mit Daten gefüllt")
+            logger.debug("Tabelle mit Daten gefüllt")
             
             # Qt übernimmt die Sortierung automatisch, da setSortingEnabled(True) gesetzt ist
             # Die Sortierung wird durch das sortIndicatorChanged Signal automatisch wiederhergestellt
@@ -668,7 +697,7 @@ class MainWindow(QMainWindow):
             
             # Adjust column widths
             self.table.resizeColumnsToContents()
-            logger.info("Spaltenbreiten angepasst")
+            logger.debug("Spaltenbreiten angepasst")
             
             # Baue Zeilen-Index nach TicketNumber auf (für Optimistic-Update-Reapply)
             self._rebuild_row_index_by_ticket()
@@ -775,17 +804,18 @@ class MainWindow(QMainWindow):
         elif ticket_number:
             # Optimistisches Speichern für direkte Tabellenedits
             try:
-                # Old-Value aus original_data ermitteln (falls vorhanden)
-                old_value = None
-                try:
-                    # Mappe Column-Header auf Schlüssel in original_data
-                    data_key = column_name
-                    for row_data in self.original_data:
-                        if row_data.get('TicketNumber') == ticket_number:
-                            old_value = row_data.get(data_key)
-                            break
-                except Exception:
-                    old_value = None
+                # Old-Value aus den zuletzt geladenen Daten ermitteln
+                row_data = self._original_by_ticket.get(ticket_number)
+                old_value = self._display_value(row_data, column_name) if row_data else None
+
+                # Unveränderte Werte nicht erneut schreiben
+                if (
+                    row_data is not None
+                    and (ticket_number, column_name) not in self._pending_updates
+                    and old_value == new_value
+                ):
+                    logger.debug(f"Keine Änderung für {ticket_number}, Spalte: {column_name}")
+                    return
 
                 # UI-Pending markieren (Text ist bereits gesetzt)
                 self._mark_cell_pending(row, column)
@@ -802,7 +832,7 @@ class MainWindow(QMainWindow):
                         QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, True))
                     except Exception as e:  # noqa: BLE001
                         logger.error(f"Fehler beim Speichern im Hintergrund: {e}")
-                        QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, False, str(e)))
+                        QTimer.singleShot(0, lambda error=str(e): self._finalize_pending_update(ticket_number, column_name, False, error))
 
                 threading.Thread(target=_save_in_background, daemon=True).start()
             except Exception as e:
@@ -850,8 +880,7 @@ class MainWindow(QMainWindow):
                     # Datum-Wert
                     if new_value and new_value.strip():
                         try:
-                            from datetime import datetime
-                            date_value = datetime.strptime(new_value, '%Y-%m-%d').date()
+                            date_value = date.fromisoformat(new_value)
                             cursor.execute(
                                 f"UPDATE {table_name} SET {field_name} = %s WHERE TicketNumber = %s",
                                 (date_value, ticket_number)
@@ -873,11 +902,8 @@ class MainWindow(QMainWindow):
                         location_id = int(new_value)
                     elif new_value:
                         # Wenn ein Name übergeben wird (z.B. durch direkte Eingabe)
-                        location_query = "SELECT ID FROM StorageLocations WHERE LocationName = %s"
-                        location_result = self.db_connection.execute_query(location_query, (new_value,))
-                        if location_result:
-                            location_id = location_result[0]['ID']
-                        else:
+                        location_id = self._get_storage_locations(cursor).get(new_value)
+                        if location_id is None:
                             logger.warning(f"Lagerort nicht gefunden: {new_value}")
                     if location_id is not None:
                         cursor.execute(
@@ -893,10 +919,8 @@ class MainWindow(QMainWindow):
                     # Handler Initials aus Namen extrahieren
                     if new_value:
                         # Extrahiere Initials aus "Name (Initials)" Format
-                        if '(' in new_value and ')' in new_value:
-                            initials = new_value.split('(')[1].split(')')[0]
-                        else:
-                            initials = new_value
+                        match = HANDLER_INITIALS_PATTERN.search(new_value)
+                        initials = match.group(1) if match else new_value
                         
                         cursor.execute(
                             f"UPDATE {table_name} SET {field_name} = %s WHERE TicketNumber = %s",
@@ -908,17 +932,8 @@ class MainWindow(QMainWindow):
                             (ticket_number,)
                         )
                 elif column_name == 'Type':
-                    # Type-Mapping: Deutsche Anzeige -> Englische Werte
-                    type_mapping = {
-                        'Reparatur': 'repair',
-                        'Widerruf': 'return',
-                        'Ersatz': 'replace',
-                        'Rückerstattung': 'refund',
-                        'Sonstiges': 'other'
-                    }
-                    
                     # Konvertiere deutschen Namen zu englischem Wert
-                    db_value = type_mapping.get(new_value, new_value)
+                    db_value = TYPE_DB_VALUES.get(new_value, new_value)
                     cursor.execute(
                         f"UPDATE {table_name} SET {field_name} = %s WHERE TicketNumber = %s",
                         (db_value, ticket_number)
@@ -978,8 +993,7 @@ class MainWindow(QMainWindow):
             current_item = self.table.item(row, column)
             if current_item and current_item.text().strip():
                 try:
-                    from datetime import datetime
-                    current_date = datetime.strptime(current_item.text(), "%Y-%m-%d").date()
+                    current_date = date.fromisoformat(current_item.text())
                     date_edit.setDate(QDate(current_date.year, current_date.month, current_date.day))
                 except ValueError:
                     # Falls das Datum nicht im erwarteten Format ist, setze heutiges Datum
@@ -1033,7 +1047,7 @@ class MainWindow(QMainWindow):
                             QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, True))
                         except Exception as e:  # noqa: BLE001
                             logger.error(f"Fehler beim Speichern des Datums: {e}")
-                            QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, False, str(e)))
+                            QTimer.singleShot(0, lambda error=str(e): self._finalize_pending_update(ticket_number, column_name, False, error))
 
                     threading.Thread(target=_save_in_background, daemon=True).start()
             return
@@ -1046,39 +1060,24 @@ class MainWindow(QMainWindow):
             if column_name == 'Status':
                 combo.addItems(['Open', 'In Progress', 'Completed', 'Waiting for Customer Feedback', 'Shipping'])
             elif column_name == 'Type':
-                # Deutsche Anzeige für Type-Werte
-                type_mapping = {
-                    'Reparatur': 'repair',
-                    'Widerruf': 'return',
-                    'Ersatz': 'replace',
-                    'Rückerstattung': 'refund',
-                    'Sonstiges': 'other'
-                }
-                
                 # Zeige deutsche Namen an, speichere englische Werte
-                combo.addItems(list(type_mapping.keys()))
-                
-                # Speichere Mapping für späteren Zugriff
-                combo.setProperty('type_mapping', type_mapping)
+                combo.addItems(list(TYPE_DB_VALUES))
             elif column_name == 'StorageLocation':
-                # Lade StorageLocations aus DB
+                # Lagerorte aus dem Cache (einmal pro Reload aus der DB)
                 try:
-                    locations_query = "SELECT ID, LocationName FROM StorageLocations ORDER BY LocationName"
-                    locations_result = self.db_connection.execute_query(locations_query)
-                    if locations_result:
-                        location_names = [row['LocationName'] for row in locations_result]
-                        combo.addItems([''] + location_names)
+                    location_map = self._get_storage_locations()
+                    if location_map:
+                        combo.addItems([''] + list(location_map))
                         # Mapping für späteren Zugriff
-                        combo.setProperty('location_map', {row['LocationName']: row['ID'] for row in locations_result})
+                        combo.setProperty('location_map', location_map)
                 except Exception as e:
                     logger.error(f"Fehler beim Laden der Lagerorte: {e}")
             elif column_name == 'LastHandler':
-                # Lade Handler aus Datenbank
+                # Handler aus dem Cache (einmal pro Reload aus der DB)
                 try:
-                    handlers_query = "SELECT Name, Initials FROM Handlers ORDER BY Name"
-                    handlers_result = self.db_connection.execute_query(handlers_query)
-                    if handlers_result:
-                        handler_names = [f"{row['Name']} ({row['Initials']})" for row in handlers_result]
+                    handlers = self._get_handlers()
+                    if handlers:
+                        handler_names = [f"{name} ({initials})" for name, initials in handlers.items()]
                         combo.addItems([''] + handler_names)
                 except Exception as e:
                     logger.error(f"Fehler beim Laden der Handler: {e}")
@@ -1142,7 +1141,7 @@ class MainWindow(QMainWindow):
                             QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, True))
                         except Exception as e:  # noqa: BLE001
                             logger.error(f"Fehler beim Speichern der Dropdown-Änderung: {e}")
-                            QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, False, str(e)))
+                            QTimer.singleShot(0, lambda error=str(e): self._finalize_pending_update(ticket_number, column_name, False, error))
 
                     threading.Thread(target=_save_in_background, daemon=True).start()
             elif column_name == 'LastHandler':
@@ -1152,8 +1151,7 @@ class MainWindow(QMainWindow):
                     handler_initials = None
                 else:
                     # Extrahiere Initials aus "Name (Initials)" Format
-                    import re
-                    match = re.search(r'\(([^)]+)\)$', selected_handler)
+                    match = HANDLER_INITIALS_PATTERN.search(selected_handler)
                     if match:
                         handler_initials = match.group(1)
                     else:
@@ -1185,7 +1183,7 @@ class MainWindow(QMainWindow):
                             QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, True))
                         except Exception as e:  # noqa: BLE001
                             logger.error(f"Fehler beim Speichern der Dropdown-Änderung: {e}")
-                            QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, False, str(e)))
+                            QTimer.singleShot(0, lambda error=str(e): self._finalize_pending_update(ticket_number, column_name, False, error))
 
                     threading.Thread(target=_save_in_background, daemon=True).start()
             elif column_name == 'Status':
@@ -1220,43 +1218,73 @@ class MainWindow(QMainWindow):
                             QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, True))
                         except Exception as e:  # noqa: BLE001
                             logger.error(f"Fehler beim Speichern im Hintergrund: {e}")
-                            QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, False, str(e)))
+                            QTimer.singleShot(0, lambda error=str(e): self._finalize_pending_update(ticket_number, column_name, False, error))
 
                     threading.Thread(target=_save_in_background, daemon=True).start()
             elif column_name == 'Type':
                 # Konvertiere deutsche Anzeige zurück zu englischen Werten
-                type_mapping = combo.property('type_mapping')
-                if type_mapping:
-                    english_value = type_mapping.get(new_value, new_value)
-                    ticket_item = self.table.item(row, 0)
-                    if ticket_item:
-                        ticket_number = ticket_item.text()
-                        current_item = self.table.item(row, column)
-                        old_value = current_item.text() if current_item else ""
-
-                        self._suppress_table_change = True
+                english_value = TYPE_DB_VALUES.get(new_value, new_value)
+                ticket_item = self.table.item(row, 0)
+                if ticket_item:
+                    ticket_number = ticket_item.text()
+                    current_item = self.table.item(row, column)
+                    old_value = current_item.text() if current_item else ""
+
+                    self._suppress_table_change = True
+                    try:
+                        if current_item:
+                            current_item.setText(new_value)
+                        self._mark_cell_pending(row, column)
+                        self._pending_updates[(ticket_number, column_name)] = {
+                            'old_value': old_value,
+                            'new_value': new_value,
+                        }
+                        # Formatierung nur für diese Zeile aktualisieren
+                        self._apply_row_formatting(row, check_duplicates=False)
+                    finally:
+                        self._suppress_table_change = False
+
+                    def _save_in_background():
                         try:
-                            if current_item:
-                                current_item.setText(new_value)
-                            self._mark_cell_pending(row, column)
-                            self._pending_updates[(ticket_number, column_name)] = {
-                                'old_value': old_value,
-                                'new_value': new_value,
-                            }
-                            # Formatierung nur für diese Zeile aktualisieren
-                            self._apply_row_formatting(row, check_duplicates=False)
-                        finally:
-                            self._suppress_table_change = False
-
-                        def _save_in_background():
-                            try:
-                                self._save_table_change(ticket_number, column_name, english_value)
-                                QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, True))
-                            except Exception as e:  # noqa: BLE001
-                                logger.error(f"Fehler beim Speichern der Dropdown-Änderung: {e}")
-                                QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, False, str(e)))
-
-                        threading.Thread(target=_save_in_background, daemon=True).start()
+                            self._save_table_change(ticket_number, column_name, english_value)
+                            QTimer.singleShot(0, lambda: self._finalize_pending_update(ticket_number, column_name, True))
+                        except Exception as e:  # noqa: BLE001
+                            logger.error(f"Fehler beim Speichern der Dropdown-Änderung: {e}")
+                            QTimer.singleShot(0, lambda error=str(e): self._finalize_pending_update(ticket_number, column_name, False, error))
+
+                    threading.Thread(target=_save_in_background, daemon=True).start()
+
+    def _get_storage_locations(self, cursor=None) -> Dict[str, int]:
+        """Gibt die Lagerorte als Mapping Name -> ID zurück.
+
+        Die kleine, selten geänderte Tabelle wird nur einmal pro Reload
+        abgefragt statt bei jedem Dropdown oder jeder Namenseingabe.
+
+        Args:
+            cursor: Offener Cursor des Aufrufers; vermeidet eine zweite
+                Pool-Verbindung mitten in dessen Transaktion
+        """
+        if self._storage_locations is None:
+            locations_query = "SELECT LocationName, ID FROM StorageLocations ORDER BY LocationName"
+            if cursor is not None:
+                cursor.execute(locations_query)
+                self._storage_locations = {
+                    row['LocationName']: row['ID'] for row in cursor.fetchall()
+                }
+            else:
+                self._storage_locations = dict(
+                    self.db_connection.execute_query(locations_query, as_tuples=True)
+                )
+        return self._storage_locations
+
+    def _get_handlers(self) -> Dict[str, str]:
+        """Gibt die Bearbeiter als Mapping Name -> Initialen zurück."""
+        if self._handlers is None:
+            handlers_query = "SELECT Name, Initials FROM Handlers ORDER BY Name"
+            self._handlers = dict(
+                self.db_connection.execute_query(handlers_query, as_tuples=True)
+            )
+        return self._handlers
 
     def _create_new_entry(self) -> None:
         """Fügt eine neue leere Zeile zur Tabelle hinzu (Google Sheets Style)."""
@@ -1802,16 +1830,8 @@ class MainWindow(QMainWindow):
                     display_value = f"{handler_name} ({initials})" if handler_name else initials
                     item = QTableWidgetItem(display_value)
                 elif key == 'Type':
-                    # Type-Mapping: Englische Werte -> Deutsche Anzeige
-                    type_mapping = {
-                        'repair': 'Reparatur',
-                        'return': 'Widerruf',
-                        'replace': 'Ersatz',
-                        'refund': 'Rückerstattung',
-                        'other': 'Sonstiges'
-                    }
                     value = row_data.get(key)
-                    display_value = type_mapping.get(value, value) if value else ''
+                    display_value = TYPE_DISPLAY_NAMES.get(value, value) if value else ''
                     item = QTableWidgetItem(display_value)
                 else:
                     value = row_data.get(key)
@@ -1858,6 +1878,8 @@ class MainWindow(QMainWindow):
     def _apply_conditional_formatting(self) -> None:
         """Wendet bedingte Formatierung basierend auf dem Status an (Google Sheets Style)."""
         try:
+            # Duplikate einmal pro Durchlauf statt einer Abfrage pro Zeile laden
+            duplicate_serials = self._fetch_duplicate_serials()
             for row in range(self.table.rowCount()):
                 # Status-Spalte finden (Spalte 4)
                 status_item = self.table.item(row, 4)  # Status ist Spalte 4
@@ -1865,30 +1887,7 @@ class MainWindow(QMainWindow):
                     continue
                 
                 status = status_item.text().strip()
-                
-                # Google Sheets Farbkodierung:
-                # 🟡 Gelb = Offene Fälle
-                # 🟢 Grün = Erledigte Fälle  
-                # 🔵 Blau = Auf Kundenrückmeldung warten
-                # ⚪ Weiß = Standard
-                if status == 'Open':
-                    # Gelb für offene Fälle (wie Google Sheets)
-                    color = QColor(255, 255, 153)  # Google Sheets Gelb
-                elif status == 'Waiting for Customer Feedback':
-                    # Blau für "auf Kundenrückmeldung warten"
-                    color = QColor(173, 216, 230)  # Google Sheets Blau
-                elif status == 'Completed':
-                    # Grün für erledigte Fälle
-                    color = QColor(144, 238, 144)  # Google Sheets Grün
-                elif status == 'In Progress':
-                    # Helles Blau für in Bearbeitung
-                    color = QColor(200, 220, 255)  # Helles Blau
-                elif status == 'Shipping':
-                    # Dunkles Blau für Shipping (DHL-Label erstellt, unterwegs)
-                    color = QColor(100, 150, 255)  # Dunkles Blau
-                else:
-                    # Standardfarbe für unbekannte Status
-                    color = QColor(255, 255, 255)  # Weiß
+                color = STATUS_COLORS.get(status, DEFAULT_STATUS_COLOR)
                 
                 # Farbe auf alle Zellen der Zeile anwenden
                 for col in range(self.table.columnCount()):
@@ -1897,7 +1896,7 @@ class MainWindow(QMainWindow):
                         item.setBackground(color)
                 
                 # Seriennummer-Duplikat-Erkennung (rote Markierung)
-                self._check_duplicate_serial_numbers(row)
+                self._check_duplicate_serial_numbers(row, duplicate_serials)
                         
         except Exception as e:
             logger.error(f"Fehler bei bedingter Formatierung: {e}")
@@ -1910,18 +1909,7 @@ class MainWindow(QMainWindow):
         try:
             status_item = self.table.item(row, 4)
             status = status_item.text().strip() if status_item else ''
-            if status == 'Open':
-                color = QColor(255, 255, 153)
-            elif status == 'Waiting for Customer Feedback':
-                color = QColor(173, 216, 230)
-            elif status == 'Completed':
-                color = QColor(144, 238, 144)
-            elif status == 'In Progress':
-                color = QColor(200, 220, 255)
-            elif status == 'Shipping':
-                color = QColor(100, 150, 255)
-            else:
-                color = QColor(255, 255, 255)
+            color = STATUS_COLORS.get(status, DEFAULT_STATUS_COLOR)
 
             for col in range(self.table.columnCount()):
                 item = self.table.item(row, col)
@@ -1933,8 +1921,15 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Fehler bei Zeilenformatierung: {e}")
 
-    def _check_duplicate_serial_numbers(self, row: int) -> None:
-        """Markiert Seriennummern rot, die bereits mehrfach in der RMA-Tabelle vorkommen."""
+    def _check_duplicate_serial_numbers(
+        self, row: int, duplicate_serials: Optional[Set[str]] = None
+    ) -> None:
+        """Markiert Seriennummern rot, die bereits mehrfach in der RMA-Tabelle vorkommen.
+
+        Args:
+            row: Tabellenzeile
+            duplicate_serials: Vorab geladene Duplikate (sonst Einzelabfrage)
+        """
         try:
             # Seriennummer-Spalte finden (normalerweise Spalte 3)
             serial_item = self.table.item(row, 3)  # Seriennummer ist Spalte 3
@@ -1946,7 +1941,11 @@ class MainWindow(QMainWindow):
                 return
             
             # Prüfe, ob diese Seriennummer bereits mehrfach existiert
-            if self._is_duplicate_serial(serial_number):
+            if duplicate_serials is not None:
+                is_duplicate = serial_number.casefold() in duplicate_serials
+            else:
+                is_duplicate = self._is_duplicate_serial(serial_number)
+            if is_duplicate:
                 # Rote Hintergrundfarbe für Seriennummer
                 serial_item.setBackground(QColor(255, 200, 200))  # Helles Rot
                 # Tooltip hinzufügen
@@ -1955,6 +1954,31 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Fehler bei Duplikat-Erkennung: {e}")
 
+    def _fetch_duplicate_serials(self) -> Set[str]:
+        """Lädt alle Seriennummern, die mehrfach in der RMA-Tabelle vorkommen.
+
+        GROUP BY liefert je Gruppe nur eine Schreibweise; die Collation der
+        Datenbank ignoriert Groß-/Kleinschreibung und folgende Leerzeichen.
+        Die Werte werden daher normalisiert (strip, casefold) zurückgegeben.
+        """
+        try:
+            if not self.db_connection:
+                return set()
+
+            query = """
+                SELECT SerialNumber
+                FROM RMA_Products
+                WHERE IsDeleted = FALSE AND SerialNumber <> ''
+                GROUP BY SerialNumber
+                HAVING COUNT(*) > 1
+            """
+            results = self.db_connection.execute_query(query, as_tuples=True)
+            return {serial.strip().casefold() for (serial,) in results}
+
+        except Exception as e:
+            logger.error(f"Fehler beim Laden der Seriennummer-Duplikate: {e}")
+            return set()
+
     def _is_duplicate_serial(self, serial_number: str) -> bool:
         """Prüft, ob eine Seriennummer bereits mehrfach in der RMA-Tabelle vorkommt."""
         try:
@@ -2068,6 +2092,39 @@ class MainWindow(QMainWindow):
             if ticket_item:
                 self._row_by_ticket[ticket_item.text()] = row
 
+    @staticmethod
+    def _display_value(row_data: Dict[str, Any], column_name: str) -> str:
+        """Liefert den Tabellentext einer Spalte aus den geladenen Zeilendaten."""
+        if column_name == 'LastHandler':
+            handler_name = row_data.get('HandlerName')
+            initials = row_data.get('LastHandler') or ''
+            return f"{handler_name} ({initials})" if handler_name else initials
+        value = row_data.get(column_name)
+        if column_name == 'Type':
+            return TYPE_DISPLAY_NAMES.get(value, value) if value else ''
+        return str(value) if value is not None else ''
+
+    @staticmethod
+    def _store_saved_value(row_data: Dict[str, Any], column_name: str, display_value: str) -> None:
+        """Überträgt einen gespeicherten Tabellentext zurück in die Zeilendaten (DB-Werte).
+
+        Abgeleitete Felder werden mitgeführt, damit ein erneutes Rendern
+        (z. B. nach einer Suche) den neuen Stand zeigt.
+        """
+        if column_name == 'LastHandler':
+            # "Name (Initialen)" wie beim Speichern in Initialen und Namen zerlegen
+            match = HANDLER_INITIALS_PATTERN.search(display_value)
+            if match:
+                row_data['LastHandler'] = match.group(1)
+                row_data['HandlerName'] = display_value[:match.start()].strip() or None
+            else:
+                row_data['LastHandler'] = display_value or None
+                row_data['HandlerName'] = None
+        elif column_name == 'Type':
+            row_data['Type'] = TYPE_DB_VALUES.get(display_value, display_value)
+        else:
+            row_data[column_name] = display_value
+
     def _get_column_index_by_name(self, column_name: str) -> int:
         """Gibt den Spaltenindex anhand des Spaltennamens zurück oder -1."""
         header = self.table.horizontalHeader()
@@ -2108,7 +2165,11 @@ class MainWindow(QMainWindow):
 
         if row_idx >= 0 and col_idx >= 0:
             if success:
-                # Erfolg: Pending-Markierung entfernen
+                # Erfolg: Bekannten Server-Stand nachziehen
+                row_data = self._original_by_ticket.get(ticket_number)
+                if pending is not None and row_data is not None and column_name in row_data:
+                    self._store_saved_value(row_data, column_name, pending.get('new_value'))
+                # Pending-Markierung entfernen
                 self._clear_cell_pending(row_idx, col_idx)
                 self.status_bar.showMessage("Änderung gespeichert", 2000)
                 # Eintrag aus Pending entfernen
@@ -114,9 +114,9 @@ def get_all_handlers(db_connection: DatabaseConnection) -> Dict[str, str]:
             SELECT Initials, Name 
             FROM Handlers 
             ORDER BY Initials
-        """)
+        """, as_tuples=True)
         
-        return {row['Initials']: row['Name'] for row in results}
+        return dict(results)
         
     except DatabaseConnectionError as e:
         logger.error(f"Datenbankfehler beim Abrufen der Handler: {e}")
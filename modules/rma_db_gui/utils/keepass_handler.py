@@ -18,6 +18,7 @@ from ..config.settings import (
     MYSQL_ENTRY,
     PRIVATE_KEY_ENTRY,
 )
+from shared.credentials.credential_cache import get_credential_cache
 from shared.credentials.keepass_handler import CentralKeePassHandler
 
 
@@ -67,8 +68,33 @@ class KeepassHandler:
             raise ValueError("Password cannot be empty")
 
         self.password = password
-        self._central_handler = CentralKeePassHandler()
-        self._load_database()
+        self._central_handler = self._get_open_central_handler(password)
+        if self._central_handler is None:
+            self._central_handler = CentralKeePassHandler()
+            self._load_database()
+
+    @staticmethod
+    def _get_open_central_handler(password: str) -> Optional[CentralKeePassHandler]:
+        """Return the already opened central handler if it was unlocked with this password.
+
+        Opening the KDBX file runs the key derivation again, which is the slow
+        part of a login. If the central login already opened the database with
+        the same master password, that handler is reused instead.
+
+        Args:
+            password: The master password for the KeePass database.
+
+        Returns:
+            The open CentralKeePassHandler or None if it cannot be reused.
+        """
+        handler = get_credential_cache().get_keepass_handler()
+        if not handler or not handler.is_database_open():
+            return None
+        user_credentials = handler.get_user_credentials()
+        if not user_credentials or user_credentials[1] != password:
+            return None
+        logger.debug("Reusing already opened central KeePass database")
+        return handler
 
     def _load_database(self) -> None:
         """Load the KeePass database using the central handler.
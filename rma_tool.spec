@@ -53,6 +53,7 @@ excludes = [
     "unittest",
     "pydoc",
     "test",
+    "main_optimized",  # Obsolete duplicate entry point, never imported
     # Include all PySide6 modules - don't exclude any
 ]
 
@@ -95,13 +96,6 @@ datas = [
     ("resources", "resources"),
 ]
 
-# Collect all Python files
-python_files = []
-for root, dirs, files in os.walk(project_root):
-    for file in files:
-        if file.endswith('.py'):
-            python_files.append(str(Path(root) / file))
-
 a = Analysis(
     [main_script],
     pathex=[str(project_root)],
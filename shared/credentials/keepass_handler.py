@@ -12,7 +12,7 @@ import sys
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Iterable, List
 
 from pykeepass import PyKeePass
 from pykeepass.exceptions import CredentialsError, HeaderChecksumError
@@ -196,6 +196,57 @@ class CentralKeePassHandler:
             self.logger.error(f"Error retrieving credentials: {str(e)}")
             return None, None
     
+    def get_credentials_batch(self, entries: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]]:
+        """Get several credentials from KeePass groups in a single pass per group.
+        
+        Args:
+            entries: Iterable of (group, entry_title) pairs
+            
+        Returns:
+            Dictionary mapping (group, entry_title) to (username, password).
+            Entries that could not be found map to (None, None).
+        """
+        wanted: Dict[str, List[str]] = {}
+        for group, entry_title in entries:
+            wanted.setdefault(group, []).append(entry_title)
+        
+        credentials: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]] = {
+            (group, entry_title): (None, None)
+            for group, titles in wanted.items()
+            for entry_title in titles
+        }
+        
+        if not self._kp:
+            self.logger.error("Database is not open.")
+            return credentials
+        
+        try:
+            for group, titles in wanted.items():
+                group_obj = self._kp.find_groups(name=group, first=True)
+                if not group_obj:
+                    self.logger.error(f"Group '{group}' not found!")
+                    continue
+                
+                remaining = set(titles)
+                for entry in group_obj.entries:
+                    if entry.title in remaining:
+                        credentials[(group, entry.title)] = (entry.username, entry.password)
+                        remaining.discard(entry.title)
+                        if not remaining:
+                            break
+                
+                for entry_title in titles:
+                    if entry_title in remaining:
+                        self.logger.error(f"Entry '{entry_title}' not found in group '{group}'!")
+                    else:
+                        self.logger.info(f"Found entry '{entry_title}' in group '{group}'")
+            
+            return credentials
+            
+        except Exception as e:
+            self.logger.error(f"Error retrieving credentials: {str(e)}")
+            return credentials
+    
     def get_all_credentials_for_module(self, module: str) -> Dict[str, Tuple[str, str]]:
         """Get all credentials for a specific module.
         
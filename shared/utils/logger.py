@@ -10,18 +10,27 @@ import os
 import sys
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 # Global variable to track if cleanup has been performed
 _cleanup_performed = False
 
-# Import settings
-try:
-    from shared.config.settings import Settings
-    _settings = Settings()
-except ImportError:
-    _settings = None
+
+
+@lru_cache(maxsize=1)
+def _get_settings():
+    """Load the application settings on first use instead of at import time.
+    
+    Returns:
+        Settings instance or None if the settings module is unavailable
+    """
+    try:
+        from shared.config.settings import Settings
+    except ImportError:
+        return None
+    return Settings()
 
 
 def cleanup_old_logs(log_dir: Path, max_age_days: int = 30, max_files: int = 50) -> None:
@@ -116,6 +125,7 @@ def setup_logger(name: str = "RMA-Tool", disable_console: bool = False) -> loggi
         # Clean up old log files only once per application start
         if not _cleanup_performed:
             # Get settings from config if available
+            _settings = _get_settings()
             if _settings and _settings.is_log_cleanup_enabled():
                 max_age_days = _settings.get_log_cleanup_max_age_days()
                 max_files = _settings.get_log_cleanup_max_files()
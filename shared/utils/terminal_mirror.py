@@ -8,18 +8,43 @@ import sys
 from io import StringIO
 from typing import Optional
 from PySide6.QtWidgets import QTextEdit, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, Signal, Slot
 from PySide6.QtGui import QFont, QTextCursor
 
 from .unified_logger import get_logger, UnifiedLogger
 
 
+class _TextAppender(QObject):
+    """Hängt Text im GUI-Thread an ein QTextEdit an.
+
+    ``append`` darf aus beliebigen Threads aufgerufen werden: der Text wird
+    über ein Signal übergeben, das bei Aufrufen aus Worker-Threads als
+    Queued Connection im GUI-Thread ankommt.
+    """
+
+    _text = Signal(str)
+
+    def __init__(self, text_widget: QTextEdit):
+        super().__init__(text_widget)
+        self.text_widget = text_widget
+        self._text.connect(self._append)
+
+    def append(self, text: str):
+        self._text.emit(text)
+
+    @Slot(str)
+    def _append(self, text: str):
+        self.text_widget.append(text)
+        self.text_widget.moveCursor(QTextCursor.MoveOperation.End)
+        self.text_widget.ensureCursorVisible()
+
+
 class StreamRedirector(StringIO):
     """Leitet stdout/stderr in ein QTextEdit-Widget um."""
     
-    def __init__(self, text_widget: QTextEdit, stream_name: str = "stdout"):
+    def __init__(self, appender: _TextAppender, stream_name: str = "stdout"):
         super().__init__()
-        self.text_widget = text_widget
+        self.appender = appender
         self.stream_name = stream_name
 
     def write(self, text):
@@ -31,9 +56,7 @@ class StreamRedirector(StringIO):
                 formatted_text = f"[OUT] {text}"
             
             # Nur in das GUI schreiben, KEIN Logging!
-            self.text_widget.append(formatted_text.rstrip())
-            self.text_widget.moveCursor(QTextCursor.MoveOperation.End)
-            self.text_widget.ensureCursorVisible()
+            self.appender.append(formatted_text.rstrip())
 
     def flush(self):
         pass
@@ -72,6 +95,8 @@ class TerminalMirrorWidget(QWidget):
             }
         """)
         layout.addWidget(self.text_widget)
+        # Schreibzugriffe aus Worker-Threads laufen über den GUI-Thread
+        self.appender = _TextAppender(self.text_widget)
         
         # Automatisch starten
         self.start_mirroring()
@@ -87,15 +112,15 @@ class TerminalMirrorWidget(QWidget):
             self.original_stderr = sys.stderr
             
             # Erstelle Redirectoren
-            self.stdout_redirector = StreamRedirector(self.text_widget, "stdout")
-            self.stderr_redirector = StreamRedirector(self.text_widget, "stderr")
+            self.stdout_redirector = StreamRedirector(self.appender, "stdout")
+            self.stderr_redirector = StreamRedirector(self.appender, "stderr")
             
             # Leite Streams um
             sys.stdout = self.stdout_redirector
             sys.stderr = self.stderr_redirector
             
             # Aktiviere GUI-Ausgabe für das einheitliche Logging
-            UnifiedLogger.enable_gui_output(self.text_widget)
+            UnifiedLogger.enable_gui_output(self.appender)
             
             # Zusätzlich: Aktiviere GUI-Ausgabe für alle loguru-Logs
             from loguru import logger
@@ -118,9 +143,8 @@ class TerminalMirrorWidget(QWidget):
         """Zusätzlicher Sink für alle loguru-Logs."""
         record = message.record
         formatted_message = f"{record['time'].strftime('%H:%M:%S')} | {record['level'].name} | {record['name']} | {record['message']}"
-        self.text_widget.append(formatted_message)
-        self.text_widget.moveCursor(QTextCursor.MoveOperation.End)
-        self.text_widget.ensureCursorVisible()
+        # loguru ruft Sinks im Thread des Aufrufers auf
+        self.appender.append(formatted_message)
             
     def stop_mirroring(self):
         """Stoppt die Terminal-Spiegelung."""
@@ -8,12 +8,53 @@ import sys
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from contextlib import contextmanager
 
 from loguru import logger
 
 
+class LogBlockRecorder:
+    """Protokoll-Funktion eines Log-Blocks mit gepufferten Ereignissen.
+
+    Direkte Aufrufe (``log("...")``) werden sofort geschrieben. Über
+    ``add_event`` gesammelte Schritte werden gepuffert und beim Verlassen
+    des Blocks als eine einzige Zeile ausgegeben. Vor jedem direkten Aufruf
+    werden bereits gesammelte Schritte ausgegeben, damit z. B. eine
+    Fehlermeldung im Log hinter den Schritten steht, die zu ihr geführt haben.
+    """
+
+    def __init__(self, logger, level: str):
+        self._logger = logger
+        self._level = level
+        self._events: List[Tuple[str, Dict[str, Any]]] = []
+
+    def __call__(self, message: str, log_level: Optional[str] = None):
+        self.flush_events()
+        self._logger.log(log_level or self._level, message)
+
+    def flush_events(self) -> None:
+        """Bisher gesammelte Schritte sofort als eine Zeile ausgeben."""
+        if self._events:
+            self._logger.log(self._level, f"Schritte: {self.format_events()}")
+            self._events.clear()
+
+    def add_event(self, name: str, **fields) -> None:
+        """Schritt für die Sammelausgabe am Blockende vormerken."""
+        self._events.append((name, fields))
+
+    def format_events(self) -> str:
+        """Gesammelte Schritte als eine Zeile formatieren."""
+        parts = []
+        for name, fields in self._events:
+            if fields:
+                details = ", ".join(f"{key}={value}" for key, value in fields.items())
+                parts.append(f"{name} ({details})")
+            else:
+                parts.append(name)
+        return " -> ".join(parts)
+
+
 class UnifiedLogger:
     """Einheitliches Logging-System für das gesamte Projekt."""
     
@@ -134,7 +175,12 @@ class UnifiedLogger:
     
     @classmethod
     def enable_gui_output(cls, gui_widget) -> None:
-        """Aktiviert GUI-Ausgabe für ein Widget."""
+        """Aktiviert GUI-Ausgabe für ein Widget.
+
+        Der Sink wird im Thread des Aufrufers ausgeführt; für Logs aus
+        Worker-Threads muss ``gui_widget.append`` daher threadsicher sein
+        (siehe ``TerminalMirrorWidget.appender``).
+        """
         if cls._gui_handler_id:
             logger.remove(cls._gui_handler_id)
         cls._gui_widget = gui_widget
@@ -163,13 +209,15 @@ class UnifiedLogger:
         """
         logger = cls.get_logger()
         logger.log(level, f"=== {name} ===")
+        recorder = LogBlockRecorder(logger, level)
         try:
-            # Erstelle eine Funktion, die den Logger verwendet
-            def log_func(message: str, log_level: str = level):
-                logger.log(log_level, message)
-            yield log_func
+            yield recorder
         finally:
-            logger.log(level, f"=== {name} abgeschlossen ===")
+            events = recorder.format_events()
+            if events:
+                logger.log(level, f"=== {name} abgeschlossen === {events}")
+            else:
+                logger.log(level, f"=== {name} abgeschlossen ===")
 
 
 # Convenience-Funktionen für einfache Verwendung